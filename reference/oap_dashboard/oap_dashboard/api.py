@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hmac
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -15,7 +16,11 @@ from .db import DashboardDB
 
 log = logging.getLogger("oap.dashboard.api")
 
+# CSafeLoader if available, else the pure-Python SafeLoader
+_YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 _db: DashboardDB | None = None
+_backend_secret: str | None = None
 
 DEFAULT_CONFIG = {
     "database": {"path": "dashboard.db"},
@@ -23,15 +28,17 @@ DEFAULT_CONFIG = {
 }
 
 
-def verify_backend_token(x_backend_token: str | None = Header(None)) -> None:
+async def verify_backend_token(x_backend_token: str | None = Header(None)) -> None:
     """Verify X-Backend-Token header matches OAP_BACKEND_SECRET env var.
 
     Skip validation if OAP_BACKEND_SECRET is not set (local dev mode).
-    Uses hmac.compare_digest for timing-safe comparison.
+    Uses hmac.compare_digest for timing-safe comparison. The secret is read
+    once at startup; async so FastAPI doesn't hop to its threadpool per request.
+    Apps served without lifespan (mounted, bare TestClient) read it per request.
     """
-    import hmac
-
-    secret = os.environ.get("OAP_BACKEND_SECRET")
+    secret = _backend_secret
+    if secret is None:
+        secret = os.environ.get("OAP_BACKEND_SECRET")
     if secret:
         if x_backend_token is None or not hmac.compare_digest(secret, x_backend_token):
             raise HTTPException(status_code=403, detail="Forbidden")
@@ -42,7 +49,7 @@ def load_config(config_path: str = "config.yaml") -> dict:
     p = Path(config_path)
     if p.exists():
         with open(p) as f:
-            file_cfg = yaml.safe_load(f) or {}
+            file_cfg = yaml.load(f, Loader=_YAMLLoader) or {}
         for section in ("database", "api"):
             if section in file_cfg:
                 cfg[section] = {**cfg[section], **file_cfg[section]}
@@ -51,7 +58,8 @@ def load_config(config_path: str = "config.yaml") -> dict:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global _db
+    global _db, _backend_secret
+    _backend_secret = os.environ.get("OAP_BACKEND_SECRET")
     config_path = getattr(app, "_config_path", "config.yaml")
     cfg = load_config(config_path)
     _db = DashboardDB(cfg["database"]["path"])
@@ -59,6 +67,7 @@ async def lifespan(app: FastAPI):
     log.info("Dashboard API started — %d manifests tracked", count)
     yield
     _db.close()
+    _backend_secret = None
 
 
 app = FastAPI(
@@ -69,26 +78,32 @@ app = FastAPI(
 )
 
 
+# DB-backed routes are plain ``def``: FastAPI runs them in its threadpool, so
+# a slow SQLite read (e.g. while the crawler holds the write lock) doesn't
+# stall the event loop. DashboardDB serializes use of its one connection
+# with a lock, so threadpool reads and crawler writes never overlap on it.
+
+
 @app.get("/stats")
-async def get_stats():
+def get_stats():
     """Current adoption stats."""
     return _db.get_stats()
 
 
 @app.get("/stats/history")
-async def get_stats_history(days: int = 30):
+def get_stats_history(days: int = 30):
     """Daily stats for the last N days."""
     return _db.get_stats_history(days)
 
 
 @app.get("/manifests")
-async def get_manifests(page: int = 1, limit: int = 50):
-    """Paginated list of tracked manifests."""
-    return _db.get_manifests(page, limit)
+def get_manifests(page: int = 1, limit: int = 50, after: str | None = None):
+    """Paginated list of tracked manifests. Pass ``next_after`` back as ``after``."""
+    return _db.get_manifests(page, limit, after)
 
 
 @app.get("/health")
-async def health():
+def health():
     stats = _db.get_stats()
     return {"status": "ok", "total_manifests": stats.get("total", 0)}
 
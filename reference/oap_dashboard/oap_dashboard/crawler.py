@@ -7,31 +7,45 @@ validates, and stores results in SQLite.
 from __future__ import annotations
 
 import asyncio
+import functools
 import hashlib
 import ipaddress
 import json
 import logging
 import socket
 import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 from urllib.parse import urlparse
 
 import httpx
 import yaml
 
+try:  # Optional fast JSON parser for fetched manifests
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 from .db import DashboardDB
 
 log = logging.getLogger("oap.dashboard.crawler")
 
+# libyaml's C loader when PyYAML was built with it; same safe semantics
+_YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+async def validate_url(url: str) -> None:
+    """Check that URL doesn't resolve to a private IP (SSRF protection).
 
-def validate_url(url: str) -> None:
-    """Check that URL doesn't resolve to a private IP (SSRF protection)."""
+    Resolves via the event loop so concurrent crawls don't block on DNS.
+    """
     parsed = urlparse(url)
     hostname = parsed.hostname
     if not hostname:
         raise ValueError(f"Invalid URL: {url}")
     try:
-        addrinfo = socket.getaddrinfo(hostname, None)
+        addrinfo = await asyncio.get_running_loop().getaddrinfo(hostname, None)
     except socket.gaierror:
         raise ValueError(f"Cannot resolve hostname: {hostname}")
     for family, type_, proto, canonname, sockaddr in addrinfo:
@@ -40,6 +54,8 @@ def validate_url(url: str) -> None:
             raise ValueError(f"URL resolves to private IP: {ip}")
 
 
+MAX_MANIFEST_SIZE = 1_048_576  # 1MB — matches the trust provider's limit
+
 DEFAULT_CONFIG = {
     "database": {"path": "dashboard.db"},
     "crawler": {
@@ -51,28 +67,93 @@ DEFAULT_CONFIG = {
 }
 
 
-async def crawl_domain(client: httpx.AsyncClient, domain: str, db: DashboardDB) -> bool:
-    """Crawl a single domain. Returns True if manifest was found and stored."""
+SNAPSHOT_BATCH_SIZE = 64
+
+
+async def _db_call(executor: Executor | None, fn, *args, **kwargs):
+    """Run a blocking DashboardDB call on the DB executor, off the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, functools.partial(fn, *args, **kwargs))
+
+
+async def _record_snapshot(
+    db: DashboardDB,
+    db_executor: Executor | None,
+    snapshots: asyncio.Queue | None,
+    domain: str,
+    status: str,
+    manifest_hash: str | None = None,
+    response_time_ms: int | None = None,
+) -> None:
+    """Queue a snapshot for the batch writer, or write it directly without one."""
+    if snapshots is None:
+        await _db_call(
+            db_executor, db.add_snapshot,
+            domain, status, manifest_hash=manifest_hash, response_time_ms=response_time_ms,
+        )
+        return
+    checked_at = datetime.utcnow().isoformat()
+    await snapshots.put((domain, checked_at, status, manifest_hash, response_time_ms))
+
+
+async def _snapshot_writer(
+    snapshots: asyncio.Queue, db: DashboardDB, db_executor: Executor | None
+) -> None:
+    """Drain queued snapshots into the DB, up to SNAPSHOT_BATCH_SIZE per commit."""
+    while True:
+        batch = [await snapshots.get()]
+        while len(batch) < SNAPSHOT_BATCH_SIZE and not snapshots.empty():
+            batch.append(snapshots.get_nowait())
+        try:
+            await _db_call(db_executor, db.add_snapshots, batch)
+        except Exception:
+            log.exception("Failed to write %d snapshots", len(batch))
+        finally:
+            for _ in batch:
+                snapshots.task_done()
+
+
+async def crawl_domain(
+    client: httpx.AsyncClient,
+    domain: str,
+    db: DashboardDB,
+    db_executor: Executor | None = None,
+    snapshots: asyncio.Queue | None = None,
+) -> bool:
+    """Crawl a single domain. Returns True if manifest was found and stored.
+
+    SQLite writes commit (and fsync) per call, so they run on ``db_executor``
+    rather than stalling the other in-flight fetches. Snapshots go onto the
+    ``snapshots`` queue when one is given and are committed in batches.
+    """
     url = f"https://{domain}/.well-known/oap.json"
 
     # SSRF protection: validate URL doesn't resolve to private IP
     try:
-        validate_url(url)
+        await validate_url(url)
     except ValueError as e:
         log.warning("%s — blocked: %s", domain, e)
         return False
 
     start = time.monotonic()
     try:
-        resp = await client.get(url, follow_redirects=False)  # Disable redirects for SSRF protection
+        # Stream the body so an oversized manifest is dropped after
+        # MAX_MANIFEST_SIZE bytes instead of being buffered whole
+        async with client.stream("GET", url, follow_redirects=False) as resp:  # Disable redirects for SSRF protection
+            if resp.status_code != 200:
+                elapsed_ms = int((time.monotonic() - start) * 1000)
+                await _record_snapshot(db, db_executor, snapshots, domain, "error", response_time_ms=elapsed_ms)
+                log.warning("%s — HTTP %d", domain, resp.status_code)
+                return False
+
+            body = bytearray()
+            async for chunk in resp.aiter_bytes():
+                body += chunk
+                if len(body) > MAX_MANIFEST_SIZE:
+                    raise ValueError("Manifest too large")
         elapsed_ms = int((time.monotonic() - start) * 1000)
 
-        if resp.status_code != 200:
-            db.add_snapshot(domain, "error", response_time_ms=elapsed_ms)
-            log.warning("%s — HTTP %d", domain, resp.status_code)
-            return False
-
-        data = resp.json()
+        data = _json_loads(body)
         manifest_hash = "sha256:" + hashlib.sha256(
             json.dumps(data, sort_keys=True).encode()
         ).hexdigest()
@@ -80,7 +161,10 @@ async def crawl_domain(client: httpx.AsyncClient, domain: str, db: DashboardDB)
         # Basic v1.0 validation
         required = ("oap", "name", "description", "invoke")
         if not all(k in data for k in required):
-            db.add_snapshot(domain, "error", manifest_hash=manifest_hash, response_time_ms=elapsed_ms)
+            await _record_snapshot(
+                db, db_executor, snapshots,
+                domain, "error", manifest_hash=manifest_hash, response_time_ms=elapsed_ms,
+            )
             log.warning("%s — missing required fields", domain)
             return False
 
@@ -90,13 +174,15 @@ async def crawl_domain(client: httpx.AsyncClient, domain: str, db: DashboardDB)
         if health_url:
             try:
                 # SSRF protection for health check URLs
-                validate_url(health_url)
+                await validate_url(health_url)
                 h = await client.get(health_url, follow_redirects=False)
                 health_ok = h.status_code == 200
             except Exception:
                 health_ok = False
 
-        is_new = db.upsert_manifest(
+        is_new = await _db_call(
+            db_executor,
+            db.upsert_manifest,
             domain=domain,
             name=data["name"],
             description=data["description"],
@@ -110,17 +196,36 @@ async def crawl_domain(client: httpx.AsyncClient, domain: str, db: DashboardDB)
             health_ok=health_ok,
         )
 
-        db.add_snapshot(domain, "ok", manifest_hash=manifest_hash, response_time_ms=elapsed_ms)
+        await _record_snapshot(
+            db, db_executor, snapshots,
+            domain, "ok", manifest_hash=manifest_hash, response_time_ms=elapsed_ms,
+        )
         log.info("%s — %s (hash=%s, %dms)", domain, "new" if is_new else "updated", manifest_hash[:20], elapsed_ms)
         return True
 
     except Exception as e:
         elapsed_ms = int((time.monotonic() - start) * 1000)
-        db.add_snapshot(domain, "error", response_time_ms=elapsed_ms)
+        await _record_snapshot(db, db_executor, snapshots, domain, "error", response_time_ms=elapsed_ms)
         log.warning("%s — %s", domain, e)
         return False
 
 
+@functools.lru_cache(maxsize=4)
+def _parse_seeds(path: str, mtime_ns: int) -> tuple[str, ...]:
+    """Parse a seeds file. mtime_ns is part of the cache key only.
+
+    Duplicate domains are dropped (first occurrence wins) so each domain is
+    fetched and written once per crawl.
+    """
+    lines = (line.strip() for line in Path(path).read_text().splitlines())
+    return tuple(dict.fromkeys(line for line in lines if line and not line.startswith("#")))
+
+
+def load_seeds(seeds_file: Path) -> tuple[str, ...]:
+    """Domains from the seeds file, re-read only when the file changes."""
+    return _parse_seeds(str(seeds_file), seeds_file.stat().st_mtime_ns)
+
+
 async def crawl_once(db: DashboardDB, cfg: dict) -> int:
     """Crawl all domains from seeds file. Returns count of successfully indexed manifests."""
     seeds_file = Path(cfg["crawler"]["seeds_file"])
@@ -128,23 +233,33 @@ async def crawl_once(db: DashboardDB, cfg: dict) -> int:
         log.error("Seeds file not found: %s", seeds_file)
         return 0
 
-    domains = [
-        line.strip()
-        for line in seeds_file.read_text().splitlines()
-        if line.strip() and not line.strip().startswith("#")
-    ]
+    domains = load_seeds(seeds_file)
     log.info("Crawling %d domains", len(domains))
 
-    sem = asyncio.Semaphore(cfg["crawler"]["concurrency"])
+    concurrency = cfg["crawler"]["concurrency"]
+    sem = asyncio.Semaphore(concurrency)
     timeout = httpx.Timeout(cfg["crawler"]["timeout_seconds"])
-
-    async with httpx.AsyncClient(timeout=timeout, http2=True) as client:
-
-        async def bounded(domain: str) -> bool:
-            async with sem:
-                return await crawl_domain(client, domain, db)
-
-        results = await asyncio.gather(*(bounded(d) for d in domains), return_exceptions=True)
+    # Size the pool to the semaphore so a raised concurrency isn't silently
+    # capped by httpx's defaults (100 connections / 20 keep-alive)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    # One writer thread: keeps SQLite access serialized and off the event loop
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="dashboard-db") as db_executor:
+        # Snapshots are batched by a background writer instead of one
+        # commit per domain; the bound applies backpressure if it falls behind
+        snapshots: asyncio.Queue = asyncio.Queue(maxsize=SNAPSHOT_BATCH_SIZE * 4)
+        writer = asyncio.create_task(_snapshot_writer(snapshots, db, db_executor))
+        try:
+            async with httpx.AsyncClient(timeout=timeout, limits=limits, http2=True) as client:
+
+                async def bounded(domain: str) -> bool:
+                    async with sem:
+                        return await crawl_domain(client, domain, db, db_executor, snapshots)
+
+                results = await asyncio.gather(*(bounded(d) for d in domains), return_exceptions=True)
+            await snapshots.join()
+        finally:
+            writer.cancel()
 
     count = sum(1 for r in results if r is True)
     db.update_daily_stats()
@@ -157,7 +272,7 @@ def load_config(config_path: str = "config.yaml") -> dict:
     p = Path(config_path)
     if p.exists():
         with open(p) as f:
-            file_cfg = yaml.safe_load(f) or {}
+            file_cfg = yaml.load(f, Loader=_YAMLLoader) or {}
         for section in ("database", "crawler"):
             if section in file_cfg:
                 cfg[section] = {**cfg[section], **file_cfg[section]}
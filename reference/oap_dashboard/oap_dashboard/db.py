@@ -4,9 +4,15 @@ from __future__ import annotations
 
 import json
 import sqlite3
-from datetime import date, datetime
+import threading
+from datetime import date, datetime, timedelta
 from pathlib import Path
 
+try:  # Optional fast JSON parser for the tags column
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
 
 SCHEMA = """
 CREATE TABLE IF NOT EXISTS manifests (
@@ -44,18 +50,36 @@ CREATE TABLE IF NOT EXISTS stats_daily (
 
 CREATE INDEX IF NOT EXISTS idx_snapshots_domain ON snapshots(domain);
 CREATE INDEX IF NOT EXISTS idx_snapshots_checked ON snapshots(checked_at);
+-- Serves get_manifests' ORDER BY in index order (no sort of the whole table)
+CREATE INDEX IF NOT EXISTS idx_manifests_last_seen ON manifests(last_seen, domain);
 """
 
 
 class DashboardDB:
     def __init__(self, db_path: str = "dashboard.db"):
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
+        # One connection shared by the crawler's DB worker thread and the API's
+        # threadpool; sqlite3 connections aren't safe for concurrent use, so
+        # every method holds _lock while it touches self.conn
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
         self.conn.row_factory = sqlite3.Row
+        # WAL lets the API read while the crawler writes; NORMAL skips the
+        # per-commit fsync (WAL still syncs at checkpoints)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        # Listing and stats queries read through a memory map (64 MB) instead
+        # of copying pages via read()
+        self.conn.execute("PRAGMA mmap_size=67108864")
         self.conn.executescript(SCHEMA)
+        # domain -> manifest_hash as last written by this process. The crawler
+        # is the only writer, so a repeat crawl of an unchanged manifest only
+        # touches the liveness columns.
+        self._stored_hashes: dict[str, str] = {}
 
     def close(self):
-        self.conn.close()
+        with self._lock:
+            self.conn.close()
 
     # --- Write operations (used by crawler) ---
 
@@ -74,48 +98,57 @@ class DashboardDB:
         health_ok: bool | None = None,
     ) -> bool:
         """Upsert a manifest. Returns True if this is a new domain."""
-        now = datetime.utcnow().isoformat()
-        existing = self.conn.execute(
-            "SELECT domain FROM manifests WHERE domain = ?", (domain,)
-        ).fetchone()
+        with self._lock:
+            now = datetime.utcnow().isoformat()
+            health = 1 if health_ok is True else (0 if health_ok is False else None)
 
-        if existing:
-            self.conn.execute(
-                """UPDATE manifests SET
-                    name=?, description=?, manifest_url=?, manifest_hash=?,
-                    last_seen=?, last_checked=?, oap_version=?,
-                    invoke_url=?, invoke_method=?, tags=?, publisher_name=?, health_ok=?
-                WHERE domain=?""",
-                (
-                    name, description, manifest_url, manifest_hash,
-                    now, now, oap_version,
-                    invoke_url, invoke_method,
-                    json.dumps(tags) if tags else None,
-                    publisher_name,
-                    1 if health_ok is True else (0 if health_ok is False else None),
-                    domain,
-                ),
-            )
-            self.conn.commit()
-            return False
-        else:
-            self.conn.execute(
+            # Membership, not .get(): a missing domain must never look like a match
+            if domain in self._stored_hashes and self._stored_hashes[domain] == manifest_hash:
+                # Same canonical manifest as last crawl — only liveness columns move
+                self.conn.execute(
+                    "UPDATE manifests SET last_seen=?, last_checked=?, health_ok=? WHERE domain=?",
+                    (now, now, health, domain),
+                )
+                self.conn.commit()
+                return False
+
+            # New domain or changed manifest: one statement either way. The WHERE
+            # skips rewriting a row whose stored hash already matches (first sight
+            # of the domain in this process), in which case nothing is returned.
+            # first_seen is only set on insert, so it equals `now` exactly when the
+            # row is new.
+            row = self.conn.execute(
                 """INSERT INTO manifests
                     (domain, name, description, manifest_url, manifest_hash,
                      first_seen, last_seen, last_checked, oap_version,
                      invoke_url, invoke_method, tags, publisher_name, health_ok)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(domain) DO UPDATE SET
+                    name=excluded.name, description=excluded.description,
+                    manifest_url=excluded.manifest_url, manifest_hash=excluded.manifest_hash,
+                    last_seen=excluded.last_seen, last_checked=excluded.last_checked,
+                    oap_version=excluded.oap_version, invoke_url=excluded.invoke_url,
+                    invoke_method=excluded.invoke_method, tags=excluded.tags,
+                    publisher_name=excluded.publisher_name, health_ok=excluded.health_ok
+                WHERE manifests.manifest_hash IS NOT excluded.manifest_hash
+                RETURNING first_seen""",
                 (
                     domain, name, description, manifest_url, manifest_hash,
                     now, now, now, oap_version,
                     invoke_url, invoke_method,
                     json.dumps(tags) if tags else None,
                     publisher_name,
-                    1 if health_ok is True else (0 if health_ok is False else None),
+                    health,
                 ),
-            )
+            ).fetchone()
+            if row is None:
+                self.conn.execute(
+                    "UPDATE manifests SET last_seen=?, last_checked=?, health_ok=? WHERE domain=?",
+                    (now, now, health, domain),
+                )
             self.conn.commit()
-            return True
+            self._stored_hashes[domain] = manifest_hash
+            return row is not None and row["first_seen"] == now
 
     def add_snapshot(
         self,
@@ -124,60 +157,106 @@ class DashboardDB:
         manifest_hash: str | None = None,
         response_time_ms: int | None = None,
     ):
-        now = datetime.utcnow().isoformat()
-        self.conn.execute(
-            "INSERT INTO snapshots (domain, checked_at, status, manifest_hash, response_time_ms) VALUES (?, ?, ?, ?, ?)",
-            (domain, now, status, manifest_hash, response_time_ms),
-        )
-        self.conn.commit()
+        with self._lock:
+            now = datetime.utcnow().isoformat()
+            self.conn.execute(
+                "INSERT INTO snapshots (domain, checked_at, status, manifest_hash, response_time_ms) VALUES (?, ?, ?, ?, ?)",
+                (domain, now, status, manifest_hash, response_time_ms),
+            )
+            self.conn.commit()
+
+    def add_snapshots(self, rows: list[tuple]):
+        """Insert many snapshots in one transaction.
+
+        Each row is ``(domain, checked_at, status, manifest_hash, response_time_ms)``.
+        """
+        with self._lock:
+            self.conn.executemany(
+                "INSERT INTO snapshots (domain, checked_at, status, manifest_hash, response_time_ms) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self.conn.commit()
 
     def update_daily_stats(self):
-        today = date.today().isoformat()
-        total = self.conn.execute("SELECT COUNT(*) FROM manifests").fetchone()[0]
-        new = self.conn.execute(
-            "SELECT COUNT(*) FROM manifests WHERE first_seen LIKE ?", (today + "%",)
-        ).fetchone()[0]
-        healthy = self.conn.execute(
-            "SELECT COUNT(*) FROM manifests WHERE health_ok = 1"
-        ).fetchone()[0]
-        self.conn.execute(
-            "INSERT OR REPLACE INTO stats_daily (date, total, new, healthy) VALUES (?, ?, ?, ?)",
-            (today, total, new, healthy),
-        )
-        self.conn.commit()
+        with self._lock:
+            today = date.today()
+            tomorrow = today + timedelta(days=1)
+            # One pass over manifests for all three counters. ISO timestamps sort
+            # lexically, so a half-open range matches "today" without a LIKE.
+            total, new, healthy = self.conn.execute(
+                """SELECT COUNT(*),
+                          COALESCE(SUM(first_seen >= ? AND first_seen < ?), 0),
+                          COALESCE(SUM(health_ok = 1), 0)
+                   FROM manifests""",
+                (today.isoformat(), tomorrow.isoformat()),
+            ).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO stats_daily (date, total, new, healthy) VALUES (?, ?, ?, ?)",
+                (today.isoformat(), total, new, healthy),
+            )
+            self.conn.commit()
 
     # --- Read operations (used by API) ---
 
     def get_stats(self) -> dict:
-        row = self.conn.execute(
-            "SELECT * FROM stats_daily ORDER BY date DESC LIMIT 1"
-        ).fetchone()
-        if not row:
-            total = self.conn.execute("SELECT COUNT(*) FROM manifests").fetchone()[0]
-            healthy = self.conn.execute(
-                "SELECT COUNT(*) FROM manifests WHERE health_ok = 1"
-            ).fetchone()[0]
-            return {"date": date.today().isoformat(), "total": total, "new": 0, "healthy": healthy}
-        return dict(row)
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT * FROM stats_daily ORDER BY date DESC LIMIT 1"
+            ).fetchone()
+            if not row:
+                total, healthy = self.conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(health_ok = 1), 0) FROM manifests"
+                ).fetchone()
+                return {"date": date.today().isoformat(), "total": total, "new": 0, "healthy": healthy}
+            return dict(row)
 
     def get_stats_history(self, days: int = 30) -> list[dict]:
-        rows = self.conn.execute(
-            "SELECT * FROM stats_daily ORDER BY date DESC LIMIT ?", (days,)
-        ).fetchall()
-        return [dict(r) for r in reversed(rows)]
-
-    def get_manifests(self, page: int = 1, limit: int = 50) -> dict:
-        offset = (page - 1) * limit
-        total = self.conn.execute("SELECT COUNT(*) FROM manifests").fetchone()[0]
-        rows = self.conn.execute(
-            "SELECT * FROM manifests ORDER BY last_seen DESC LIMIT ? OFFSET ?",
-            (limit, offset),
-        ).fetchall()
-        manifests = []
-        for r in rows:
-            m = dict(r)
-            if m.get("tags"):
-                m["tags"] = json.loads(m["tags"])
-            m["health_ok"] = bool(m["health_ok"]) if m["health_ok"] is not None else None
-            manifests.append(m)
-        return {"manifests": manifests, "total": total, "page": page, "limit": limit}
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT * FROM stats_daily ORDER BY date DESC LIMIT ?", (days,)
+            ).fetchall()
+            return [dict(r) for r in reversed(rows)]
+
+    def get_manifests(self, page: int = 1, limit: int = 50, after: str | None = None) -> dict:
+        """One page of manifests, most recently seen first.
+
+        ``after`` is the ``next_after`` cursor of the previous page. It seeks
+        straight to (last_seen, domain) in the index, so deep pages cost the
+        same as the first; ``page`` uses OFFSET and is kept for simple callers.
+        """
+        with self._lock:
+            total = self.conn.execute("SELECT COUNT(*) FROM manifests").fetchone()[0]
+            if after:
+                last_seen, _, domain = after.partition("|")
+                rows = self.conn.execute(
+                    "SELECT * FROM manifests WHERE (last_seen, domain) < (?, ?) "
+                    "ORDER BY last_seen DESC, domain DESC LIMIT ?",
+                    (last_seen, domain, limit + 1),
+                ).fetchall()
+            else:
+                rows = self.conn.execute(
+                    "SELECT * FROM manifests ORDER BY last_seen DESC, domain DESC LIMIT ? OFFSET ?",
+                    (limit + 1, (page - 1) * limit),
+                ).fetchall()
+            # The extra row only tells us whether another page exists
+            has_more = len(rows) > limit
+            rows = rows[:limit]
+            manifests = [_manifest_from_row(r) for r in rows]
+            next_after = f"{rows[-1]['last_seen']}|{rows[-1]['domain']}" if has_more else None
+            return {
+                "manifests": manifests,
+                "total": total,
+                "page": page,
+                "limit": limit,
+                "next_after": next_after,
+            }
+
+
+def _manifest_from_row(row: sqlite3.Row) -> dict:
+    """API shape of a manifests row: tags decoded, health_ok as bool/None."""
+    m = dict(row)
+    if m["tags"]:
+        m["tags"] = _json_loads(m["tags"])
+    if m["health_ok"] is not None:
+        m["health_ok"] = bool(m["health_ok"])
+    return m
@@ -0,0 +1,15 @@
+"""Shared fixtures for dashboard tests."""
+
+from __future__ import annotations
+
+import pytest
+
+from oap_dashboard.db import DashboardDB
+
+
+@pytest.fixture
+def db():
+    """In-memory dashboard database."""
+    d = DashboardDB(":memory:")
+    yield d
+    d.close()
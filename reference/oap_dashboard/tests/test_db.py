@@ -0,0 +1,65 @@
+"""Tests for the dashboard SQLite data layer."""
+
+from __future__ import annotations
+
+from oap_dashboard.db import DashboardDB
+
+
+def _seed(db: DashboardDB, rows: list[tuple[str, str]]) -> None:
+    """Insert manifests with fixed (domain, last_seen) values."""
+    for domain, last_seen in rows:
+        db.upsert_manifest(domain, domain, "desc", f"https://{domain}/", f"h-{domain}", "1.0")
+        db.conn.execute(
+            "UPDATE manifests SET last_seen = ? WHERE domain = ?", (last_seen, domain)
+        )
+    db.conn.commit()
+
+
+def _walk(db: DashboardDB, limit: int) -> list[list[str]]:
+    """Follow next_after cursors from the first page; domains per page."""
+    pages = []
+    result = db.get_manifests(limit=limit)
+    while True:
+        pages.append([m["domain"] for m in result["manifests"]])
+        if result["next_after"] is None:
+            return pages
+        result = db.get_manifests(limit=limit, after=result["next_after"])
+
+
+class TestKeysetPagination:
+    def test_cursor_walks_every_row_once(self, db: DashboardDB):
+        _seed(db, [(f"d{i}.example", f"2026-01-0{i}T00:00:00") for i in range(1, 8)])
+        pages = _walk(db, limit=3)
+        assert [len(p) for p in pages] == [3, 3, 1]
+        flat = [d for p in pages for d in p]
+        assert flat == [f"d{i}.example" for i in range(7, 0, -1)]
+
+    def test_cursor_breaks_last_seen_ties_by_domain(self, db: DashboardDB):
+        """Rows sharing last_seen straddle a page boundary without loss or repeats."""
+        same = "2026-01-01T00:00:00"
+        _seed(db, [("a.example", same), ("b.example", same), ("c.example", same),
+                   ("d.example", "2026-01-02T00:00:00")])
+        pages = _walk(db, limit=2)
+        assert pages == [["d.example", "c.example"], ["b.example", "a.example"]]
+
+    def test_cursor_matches_offset_pages(self, db: DashboardDB):
+        _seed(db, [(f"d{i}.example", f"2026-01-0{i % 3 + 1}T00:00:00") for i in range(8)])
+        offset_pages = [
+            [m["domain"] for m in db.get_manifests(page=n, limit=3)["manifests"]]
+            for n in (1, 2, 3)
+        ]
+        assert _walk(db, limit=3) == offset_pages
+
+    def test_exactly_full_last_page_has_no_cursor(self, db: DashboardDB):
+        _seed(db, [(f"d{i}.example", f"2026-01-0{i}T00:00:00") for i in range(1, 5)])
+        first = db.get_manifests(limit=2)
+        assert first["next_after"] is not None
+        last = db.get_manifests(limit=2, after=first["next_after"])
+        assert len(last["manifests"]) == 2
+        assert last["next_after"] is None
+        assert db.get_manifests(page=2, limit=2)["next_after"] is None
+
+    def test_empty_table(self, db: DashboardDB):
+        result = db.get_manifests(limit=5)
+        assert result["manifests"] == []
+        assert result["next_after"] is None
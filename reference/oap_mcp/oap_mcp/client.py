@@ -2,13 +2,34 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
+import time
+from collections import OrderedDict
 from typing import Any
 
 import httpx
 
+try:  # Optional fast JSON codec for request/response bodies
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode()
+
 log = logging.getLogger("oap.mcp.client")
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+DISCOVER_CACHE_SIZE = 128
+DISCOVER_CACHE_TTL = 300  # seconds — the server's manifest index changes underneath us
+
 
 class OAPClient:
     """Thin async wrapper around the OAP discovery API.
@@ -17,11 +38,31 @@ class OAPClient:
     Tool execution routes (/v1/tools/call/*) are unprotected (local-only).
     """
 
-    def __init__(self, base_url: str, token: str | None = None, timeout: float = 120):
+    def __init__(
+        self,
+        base_url: str,
+        token: str | None = None,
+        timeout: float = 120,
+        discover_cache_size: int = DISCOVER_CACHE_SIZE,
+        discover_cache_ttl: float = DISCOVER_CACHE_TTL,
+    ):
         self._base_url = base_url.rstrip("/")
         self._token = token
         self._timeout = timeout
         self._client: httpx.AsyncClient | None = None
+        # Request headers are fixed for the client's lifetime — build them once
+        self._auth_headers = {"X-Backend-Token": token} if token else {}
+        self._auth_json_headers = {**self._auth_headers, **_JSON_HEADERS}
+        # LRU of raw discover response bodies keyed by (task, top_k) digest —
+        # each miss costs an embedding + vector search + LLM ranking on the
+        # server. Bodies are kept as bytes: far smaller than the parsed dicts,
+        # and every hit hands the caller a fresh, unshared result.
+        self._discover_cache: OrderedDict[bytes, tuple[float, bytes]] = OrderedDict()
+        self._discover_cache_size = discover_cache_size
+        self._discover_cache_ttl = discover_cache_ttl
+        # Discover requests currently on the wire, by the same key — identical
+        # concurrent calls await one request instead of each sending their own
+        self._discover_inflight: dict[bytes, asyncio.Task[bytes]] = {}
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None or self._client.is_closed:
@@ -31,45 +72,85 @@ class OAPClient:
             )
         return self._client
 
-    def _auth_headers(self) -> dict[str, str]:
-        if self._token:
-            return {"X-Backend-Token": self._token}
-        return {}
-
     async def health(self) -> dict[str, Any]:
         """GET /health — check service status."""
         client = await self._get_client()
-        resp = await client.get("/health", headers=self._auth_headers())
+        resp = await client.get("/health", headers=self._auth_headers)
         resp.raise_for_status()
-        return resp.json()
+        return _json_loads(resp.content)
+
+    @staticmethod
+    def _discover_key(task: str, top_k: int) -> bytes:
+        # Agent loops resend the same task with stray case/whitespace changes
+        normalized = " ".join(task.lower().split())
+        return hashlib.blake2b(f"{top_k}|{normalized}".encode(), digest_size=16).digest()
 
     async def discover(self, task: str, top_k: int = 5) -> dict[str, Any]:
-        """POST /v1/discover — natural language task-to-manifest matching."""
+        """POST /v1/discover — natural language task-to-manifest matching.
+
+        Responses are cached per (normalized task, top_k) for up to
+        ``discover_cache_ttl`` seconds; repeats skip the round-trip, and
+        concurrent identical calls share a single in-flight request.
+        """
+        key = self._discover_key(task, top_k)
+        cached = self._discover_cache.get(key)
+        if cached is not None:
+            stored_at, body = cached
+            if time.monotonic() - stored_at < self._discover_cache_ttl:
+                self._discover_cache.move_to_end(key)
+                return _json_loads(body)
+            del self._discover_cache[key]
+
+        inflight = self._discover_inflight.get(key)
+        if inflight is None:
+            inflight = asyncio.ensure_future(self._fetch_discover(key, task, top_k))
+            self._discover_inflight[key] = inflight
+
+            def _done(t: asyncio.Task[bytes]) -> None:
+                self._discover_inflight.pop(key, None)
+                # Retrieve the exception here: if every waiter was cancelled,
+                # nobody else will, and asyncio would log it as never retrieved
+                if not t.cancelled():
+                    t.exception()
+
+            inflight.add_done_callback(_done)
+        # shield: one caller being cancelled must not cancel the shared request
+        body = await asyncio.shield(inflight)
+        return _json_loads(body)
+
+    async def _fetch_discover(self, key: bytes, task: str, top_k: int) -> bytes:
+        """Send one /v1/discover request and cache the raw body."""
         client = await self._get_client()
         resp = await client.post(
             "/v1/discover",
-            json={"task": task, "top_k": top_k},
-            headers=self._auth_headers(),
+            content=_json_dumps({"task": task, "top_k": top_k}),
+            headers=self._auth_json_headers,
         )
         resp.raise_for_status()
-        return resp.json()
+
+        if self._discover_cache_size > 0:
+            self._discover_cache[key] = (time.monotonic(), resp.content)
+            if len(self._discover_cache) > self._discover_cache_size:
+                self._discover_cache.popitem(last=False)
+        return resp.content
 
     async def list_manifests(self) -> list[dict[str, Any]]:
         """GET /v1/manifests — list all indexed manifests."""
         client = await self._get_client()
-        resp = await client.get("/v1/manifests", headers=self._auth_headers())
+        resp = await client.get("/v1/manifests", headers=self._auth_headers)
         resp.raise_for_status()
-        return resp.json()
+        return _json_loads(resp.content)
 
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         """POST /v1/tools/call/{tool_name} — execute a tool. No auth (local-only)."""
         client = await self._get_client()
         resp = await client.post(
             f"/v1/tools/call/{tool_name}",
-            json=arguments,
+            content=_json_dumps(arguments),
+            headers=_JSON_HEADERS,
         )
         resp.raise_for_status()
-        return resp.json()
+        return _json_loads(resp.content)
 
     async def close(self):
         if self._client and not self._client.is_closed:
@@ -11,6 +11,7 @@ All logging goes to stderr (stdout is the MCP JSON-RPC stream).
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
 import os
 import re
@@ -34,14 +35,18 @@ mcp = FastMCP("oap")
 # Module-level client — initialized in main() before mcp.run()
 _client: OAPClient | None = None
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
 
+
+@functools.lru_cache(maxsize=2048)
 def _tool_name_from_manifest(name: str) -> str:
     """Convert a manifest name to an oap_ tool name.
 
     Same logic as tool_converter.manifest_to_tool_name() — inlined
-    to avoid depending on oap_discovery.
+    to avoid depending on oap_discovery. Memoized: the same manifests
+    come back in discover results over and over.
     """
-    slug = re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+    slug = _SLUG_RE.sub("_", name.lower()).strip("_")
     return f"oap_{slug}"
 
 
@@ -61,7 +66,7 @@ def _format_discover_result(data: dict[str, Any]) -> str:
 
     if match:
         tool_name = _tool_name_from_manifest(match["name"])
-        method = match.get("invoke", {}).get("method", "?").upper()
+        method = (match.get("invoke") or {}).get("method", "?").upper()
         lines.append(f"Best match: {tool_name}")
         lines.append(f"  Name: {match['name']}")
         lines.append(f"  Method: {method}")
@@ -74,7 +79,7 @@ def _format_discover_result(data: dict[str, Any]) -> str:
         lines.append(f"Candidates ({len(candidates)}):")
         for c in candidates:
             tool_name = _tool_name_from_manifest(c["name"])
-            method = c.get("invoke", {}).get("method", "?").upper()
+            method = (c.get("invoke") or {}).get("method", "?").upper()
             score = c.get("score", 0)
             lines.append(f"  - {tool_name} [{method}] (score: {score:.3f})")
             lines.append(f"    {c['description'][:200]}")
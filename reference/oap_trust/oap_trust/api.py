@@ -2,21 +2,27 @@
 
 from __future__ import annotations
 
+import hmac
 import logging
 import os
+import time
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 import uvicorn
-from fastapi import Depends, FastAPI, HTTPException, Header
+from fastapi import Depends, FastAPI, HTTPException, Header, Response
+from pydantic import TypeAdapter
 
 from .attestation import AttestationService
 from .config import Config, load_config
 from .db import TrustStore
 from .keys import KeyManager
+from .manifest import new_shared_http_client, set_http_client
 from .models import (
+    AttestationRecord,
     AttestCapabilityRequest,
     AttestDomainRequest,
+    CapabilityTestResult,
     ChallengeResponse,
     ChallengeStatusResponse,
     DomainAttestationsResponse,
@@ -26,22 +32,33 @@ from .models import (
 
 log = logging.getLogger("oap.trust.api")
 
+# Serializes the capability response in one pass straight to JSON bytes
+_CAPABILITY_ADAPTER = TypeAdapter(dict[str, CapabilityTestResult | AttestationRecord])
+
 # Module-level state, initialized during lifespan
 _service: AttestationService | None = None
 _keys: KeyManager | None = None
 _store: TrustStore | None = None
 _cfg: Config | None = None
+_jwks_body: bytes | None = None  # Serialized once per keypair
+_backend_secret: str | None = None
+
+# Readiness probes poll /health; the attestation count scans the table
+HEALTH_CACHE_TTL = 2.0  # seconds
+_health_cache: tuple[float, bytes] | None = None  # (monotonic, JSON body)
 
 
-def verify_backend_token(x_backend_token: str | None = Header(None)) -> None:
+async def verify_backend_token(x_backend_token: str | None = Header(None)) -> None:
     """Verify X-Backend-Token header matches OAP_BACKEND_SECRET env var.
 
     Skip validation if OAP_BACKEND_SECRET is not set (local dev mode).
-    Uses hmac.compare_digest for timing-safe comparison.
+    Uses hmac.compare_digest for timing-safe comparison. The secret is read
+    once at startup; async so FastAPI doesn't hop to its threadpool per request.
+    Apps served without lifespan (mounted, bare TestClient) read it per request.
     """
-    import hmac
-
-    secret = os.environ.get("OAP_BACKEND_SECRET")
+    secret = _backend_secret
+    if secret is None:
+        secret = os.environ.get("OAP_BACKEND_SECRET")
     if secret:
         if x_backend_token is None or not hmac.compare_digest(secret, x_backend_token):
             raise HTTPException(status_code=403, detail="Forbidden")
@@ -61,22 +78,30 @@ def _find_config() -> str:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global _service, _keys, _store, _cfg
+    global _service, _keys, _store, _cfg, _health_cache, _jwks_body, _backend_secret
+
+    _backend_secret = os.environ.get("OAP_BACKEND_SECRET")
 
     config_path = _find_config()
     _cfg = load_config(config_path)
 
     _keys = KeyManager(_cfg.keys)
     _keys.initialize()
+    _jwks_body = JWKSResponse(**_keys.jwks()).model_dump_json().encode()
 
     _store = TrustStore(_cfg.database)
     _service = AttestationService(_cfg, _keys, _store)
+    _health_cache = None
+
+    # One pooled client for all outbound fetches (manifests, capability
+    # tests, HTTP challenges) instead of a fresh connection per request
+    http = new_shared_http_client()
+    set_http_client(http)
 
     # Cleanup expired records at startup
-    expired_challenges = _store.cleanup_expired_challenges()
+    expired_challenges, expired_attestations = _store.cleanup_expired()
     if expired_challenges:
         log.info("Cleaned up %d expired challenge(s)", expired_challenges)
-    expired_attestations = _store.cleanup_expired_attestations()
     if expired_attestations:
         log.info("Cleaned up %d expired attestation(s)", expired_attestations)
 
@@ -84,7 +109,10 @@ async def lifespan(app: FastAPI):
     log.info("Trust API started — %d active attestations", count)
     yield
 
+    set_http_client(None)
+    await http.aclose()
     _store.close()
+    _backend_secret = None
 
 
 app = FastAPI(
@@ -120,46 +148,54 @@ async def attest_domain_status(domain: str) -> ChallengeStatusResponse:
 
 
 @app.post("/v1/attest/capability")
-async def attest_capability(req: AttestCapabilityRequest) -> dict:
+async def attest_capability(req: AttestCapabilityRequest) -> Response:
     """Run Layer 2 capability tests and issue attestation if passed."""
     test_result, attestation = await _service.attest_capability(req.domain)
-    resp = {"test_result": test_result.model_dump()}
+    resp: dict[str, CapabilityTestResult | AttestationRecord] = {"test_result": test_result}
     if attestation:
-        resp["attestation"] = attestation.model_dump(mode="json")
-    return resp
+        resp["attestation"] = attestation
+    return Response(content=_CAPABILITY_ADAPTER.dump_json(resp), media_type="application/json")
 
 
 # --- Query ---
 
 
 @app.get("/v1/attestations/{domain}", response_model=DomainAttestationsResponse)
-async def get_attestations(domain: str) -> DomainAttestationsResponse:
+async def get_attestations(domain: str) -> Response:
     """Fetch all valid attestations for a domain. This is what agents query."""
     attestations = _service.get_attestations(domain)
-    return DomainAttestationsResponse(domain=domain, attestations=attestations)
+    # Records were validated on the way out of the store. Returning a Response
+    # skips FastAPI's response_model re-validation; the model stays for the schema.
+    resp = DomainAttestationsResponse.model_construct(domain=domain, attestations=attestations)
+    return Response(content=resp.model_dump_json(), media_type="application/json")
 
 
 # --- Keys ---
 
 
 @app.get("/v1/keys", response_model=JWKSResponse)
-async def get_keys() -> JWKSResponse:
+async def get_keys() -> Response:
     """JWKS public keys for verifying attestation signatures."""
-    return JWKSResponse(**_keys.jwks())
+    return Response(content=_jwks_body, media_type="application/json")
 
 
 # --- Health ---
 
 
 @app.get("/health", response_model=HealthResponse)
-async def health() -> HealthResponse:
-    """Health check."""
-    count = _store.count_attestations()
-    return HealthResponse(
-        status="ok",
-        attestation_count=count,
-        key_loaded=_keys.is_loaded,
-    )
+async def health() -> Response:
+    """Health check. Cached for HEALTH_CACHE_TTL seconds."""
+    global _health_cache
+    now = time.monotonic()
+    if _health_cache is None or now - _health_cache[0] >= HEALTH_CACHE_TTL:
+        count = _store.count_attestations()
+        body = HealthResponse(
+            status="ok",
+            attestation_count=count,
+            key_loaded=_keys.is_loaded,
+        ).model_dump_json()
+        _health_cache = (now, body.encode())
+    return Response(content=_health_cache[1], media_type="application/json")
 
 
 def main() -> None:
@@ -5,6 +5,8 @@ from __future__ import annotations
 import logging
 from datetime import datetime, timedelta, timezone
 
+from pydantic import TypeAdapter
+
 from .capability_test import test_capability
 from .config import Config
 from .db import TrustStore
@@ -28,6 +30,9 @@ log = logging.getLogger("oap.trust.attestation")
 
 ISSUER = "oap-trust-reference"
 
+# Compiled once — validates stored rows (ISO timestamps included) in a single pass
+_RECORDS_ADAPTER = TypeAdapter(list[AttestationRecord])
+
 
 class AttestationService:
     """Orchestrates the full attestation flow across all layers."""
@@ -113,8 +118,23 @@ class AttestationService:
                       f"Ensure the {challenge['method'].upper()} record/file is in place.",
             )
 
-        # Mark challenge done
-        self._store.mark_challenge_verified(challenge["token"])
+        # Mark challenge done — a concurrent status check may have claimed it first
+        if not self._store.mark_challenge_verified(challenge["token"]):
+            # Only an attestation signed after this challenge was created can
+            # be the winner's; an older one would report a stale JWS and hash
+            issued = self._store.get_latest_attestation(domain, 1)
+            if issued is None or issued["issued_at"] < challenge["created_at"]:
+                return ChallengeStatusResponse(
+                    domain=domain,
+                    challenge_verified=False,
+                    error="Challenge verification is already in progress or completed "
+                          f"by another request; fetch /v1/attestations/{domain}",
+                )
+            return ChallengeStatusResponse(
+                domain=domain,
+                challenge_verified=True,
+                attestation=AttestationRecord.model_validate(issued),
+            )
 
         # Re-fetch manifest for current hash
         try:
@@ -196,18 +216,7 @@ class AttestationService:
     def get_attestations(self, domain: str) -> list[AttestationRecord]:
         """Get all valid attestations for a domain."""
         rows = self._store.get_attestations(domain)
-        return [
-            AttestationRecord(
-                domain=r["domain"],
-                layer=r["layer"],
-                jws=r["jws"],
-                manifest_hash=r["manifest_hash"],
-                issued_at=datetime.fromisoformat(r["issued_at"]),
-                expires_at=datetime.fromisoformat(r["expires_at"]),
-                verification_method=r.get("verification_method"),
-            )
-            for r in rows
-        ]
+        return _RECORDS_ADAPTER.validate_python(rows)
 
     # --- Internal ---
 
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 import httpx
 
 from .config import AttestationConfig
-from .manifest import _validate_url
+from .manifest import REQUEST_HEADERS, _validate_url, http_client
 from .models import CapabilityTestResult
 
 log = logging.getLogger("oap.trust.capability")
@@ -15,6 +16,127 @@ log = logging.getLogger("oap.trust.capability")
 TIMEOUT = 10.0
 
 
+# Bodies up to this size are drained so the connection goes back to the pool
+PROBE_DRAIN_LIMIT = 64 * 1024
+
+
+async def _probe(
+    client: httpx.AsyncClient, method: str, url: str, **kwargs
+) -> tuple[int, httpx.Headers]:
+    """Send a request and return its status code and headers.
+
+    The checks never look at the body. A short one is drained so the shared
+    client can reuse the connection; past PROBE_DRAIN_LIMIT we stop reading
+    and the connection is closed, so an endpoint under test can't make us
+    download an arbitrarily large response.
+    """
+    kwargs.setdefault("headers", REQUEST_HEADERS)
+    async with client.stream(
+        method, url, timeout=TIMEOUT, follow_redirects=True, **kwargs
+    ) as resp:
+        drained = 0
+        async for chunk in resp.aiter_raw():
+            drained += len(chunk)
+            if drained > PROBE_DRAIN_LIMIT:
+                break
+        return resp.status_code, resp.headers
+
+
+async def _check_liveness(
+    client: httpx.AsyncClient, url: str, method: str
+) -> tuple[bool, str | None]:
+    """Test 1: endpoint liveness. Returns (live, error)."""
+    try:
+        if method in ("GET", "HEAD"):
+            status, _ = await _probe(client, "GET", url)
+        else:
+            # For POST/PUT/etc, send a HEAD-like request first
+            status, _ = await _probe(client, "HEAD", url)
+    except httpx.RequestError as e:
+        return False, f"Endpoint unreachable: {e}"
+    # Accept any non-5xx response as "live"
+    if status < 500:
+        return True, None
+    return False, f"Endpoint returned {status}"
+
+
+async def _check_health(
+    client: httpx.AsyncClient, health_url: str | None, *, allow_http: bool
+) -> tuple[bool | None, str | None]:
+    """Test 2: health endpoint, if declared. Returns (health_ok, error)."""
+    if not health_url:
+        return None, None
+    try:
+        await _validate_url(health_url, allow_http=allow_http)
+        status, _ = await _probe(client, "GET", health_url)
+    except (httpx.RequestError, ValueError) as e:
+        return False, f"Health check failed: {e}"
+    if status < 400:
+        return True, None
+    return False, f"Health endpoint returned {status}"
+
+
+def _unwrap(outcome: tuple | BaseException) -> tuple:
+    """Turn a gather(return_exceptions=True) slot into an (ok, error) pair."""
+    if isinstance(outcome, BaseException):
+        return False, f"Check failed: {outcome}"
+    return outcome
+
+
+async def _check_example(
+    client: httpx.AsyncClient, manifest: dict, example: dict, url: str, method: str
+) -> tuple[bool | None, bool | None, list[str]]:
+    """Test 3: example invocation. Returns (example_passed, format_match, errors)."""
+    errors: list[str] = []
+    example_passed: bool | None = None
+    format_match: bool | None = None
+    example_input = example.get("input")
+    try:
+        if method == "POST" and example_input is not None:
+            # Determine content type
+            input_spec = manifest.get("input", {})
+            content_type = input_spec.get("format", "application/json")
+
+            if "json" in content_type:
+                status, resp_headers = await _probe(client, "POST", url, json=example_input)
+            else:
+                headers = {**REQUEST_HEADERS, "Content-Type": content_type}
+                status, resp_headers = await _probe(
+                    client,
+                    "POST",
+                    url,
+                    content=str(example_input).encode() if not isinstance(example_input, bytes) else example_input,
+                    headers=headers,
+                )
+
+            example_passed = status < 400
+            if not example_passed:
+                errors.append(f"Example invocation returned {status}")
+
+            # Check output format if specified
+            output_spec = manifest.get("output", {})
+            expected_format = output_spec.get("format")
+            if expected_format and example_passed:
+                actual_ct = resp_headers.get("content-type", "")
+                # Loose match — "application/json" matches "application/json; charset=utf-8"
+                format_match = expected_format.split(";")[0] in actual_ct
+                if not format_match:
+                    errors.append(
+                        f"Output format mismatch: expected {expected_format}, "
+                        f"got {actual_ct}"
+                    )
+
+        elif method == "GET":
+            status, _ = await _probe(client, "GET", url)
+            example_passed = status < 400
+            if not example_passed:
+                errors.append(f"GET invocation returned {status}")
+    except httpx.RequestError as e:
+        example_passed = False
+        errors.append(f"Example invocation failed: {e}")
+    return example_passed, format_match, errors
+
+
 async def test_capability(
     manifest: dict,
     cfg: AttestationConfig,
@@ -42,23 +164,24 @@ async def test_capability(
             errors=["No invoke URL in manifest"],
         )
 
-    # SSRF protection
-    try:
-        _validate_url(url, allow_http=allow_http)
-    except ValueError as e:
+    # Skip auth-gated endpoints — we can't test them without credentials.
+    # Checked before the SSRF check so we don't resolve DNS for nothing.
+    auth = invoke.get("auth")
+    if auth and auth != "none":
         return CapabilityTestResult(
             endpoint_live=False,
             passed=False,
-            errors=[f"Invoke URL failed safety check: {e}"],
+            errors=[f"Cannot test auth-gated endpoint (auth: {auth})"],
         )
 
-    # Skip auth-gated endpoints — we can't test them without credentials
-    auth = invoke.get("auth")
-    if auth and auth != "none":
+    # SSRF protection
+    try:
+        await _validate_url(url, allow_http=allow_http)
+    except ValueError as e:
         return CapabilityTestResult(
             endpoint_live=False,
             passed=False,
-            errors=[f"Cannot test auth-gated endpoint (auth: {auth})"],
+            errors=[f"Invoke URL failed safety check: {e}"],
         )
 
     result = CapabilityTestResult(
@@ -66,109 +189,28 @@ async def test_capability(
         passed=False,
     )
 
-    async with httpx.AsyncClient() as client:
-        # Test 1: Endpoint liveness
-        try:
-            if method in ("GET", "HEAD"):
-                resp = await client.get(
-                    url,
-                    timeout=TIMEOUT,
-                    headers={"User-Agent": "OAP-Trust/0.1"},
-                    follow_redirects=True,
-                )
-            else:
-                # For POST/PUT/etc, send a HEAD-like request first
-                resp = await client.head(
-                    url,
-                    timeout=TIMEOUT,
-                    headers={"User-Agent": "OAP-Trust/0.1"},
-                    follow_redirects=True,
-                )
-            # Accept any non-5xx response as "live"
-            result.endpoint_live = resp.status_code < 500
-            if not result.endpoint_live:
-                errors.append(f"Endpoint returned {resp.status_code}")
-        except httpx.RequestError as e:
-            errors.append(f"Endpoint unreachable: {e}")
-
-        # Test 2: Health endpoint (if declared)
-        health_url = manifest.get("health")
-        if health_url:
-            try:
-                _validate_url(health_url, allow_http=allow_http)
-                health_resp = await client.get(
-                    health_url,
-                    timeout=TIMEOUT,
-                    headers={"User-Agent": "OAP-Trust/0.1"},
-                    follow_redirects=True,
-                )
-                result.health_ok = health_resp.status_code < 400
-                if not result.health_ok:
-                    errors.append(f"Health endpoint returned {health_resp.status_code}")
-            except (httpx.RequestError, ValueError) as e:
-                result.health_ok = False
-                errors.append(f"Health check failed: {e}")
-
-        # Test 3: Example invocation (if examples provided)
+    async with http_client() as client:
+        # Liveness and health are independent probes — run them concurrently
+        live_outcome, health_outcome = await asyncio.gather(
+            _check_liveness(client, url, method),
+            _check_health(client, manifest.get("health"), allow_http=allow_http),
+            return_exceptions=True,
+        )
+        live, live_error = _unwrap(live_outcome)
+        health_ok, health_error = _unwrap(health_outcome)
+        result.endpoint_live = live
+        result.health_ok = health_ok
+        errors.extend(e for e in (live_error, health_error) if e)
+
+        # The example may have side effects — only send it to a live endpoint
         examples = manifest.get("examples", [])
         if examples and result.endpoint_live:
-            example = examples[0]
-            example_input = example.get("input")
-            try:
-                if method == "POST" and example_input is not None:
-                    # Determine content type
-                    input_spec = manifest.get("input", {})
-                    content_type = input_spec.get("format", "application/json")
-
-                    headers = {"User-Agent": "OAP-Trust/0.1"}
-                    if "json" in content_type:
-                        resp = await client.post(
-                            url,
-                            json=example_input,
-                            timeout=TIMEOUT,
-                            headers=headers,
-                            follow_redirects=True,
-                        )
-                    else:
-                        headers["Content-Type"] = content_type
-                        resp = await client.post(
-                            url,
-                            content=str(example_input).encode() if not isinstance(example_input, bytes) else example_input,
-                            timeout=TIMEOUT,
-                            headers=headers,
-                            follow_redirects=True,
-                        )
-
-                    result.example_passed = resp.status_code < 400
-                    if not result.example_passed:
-                        errors.append(f"Example invocation returned {resp.status_code}")
-
-                    # Check output format if specified
-                    output_spec = manifest.get("output", {})
-                    expected_format = output_spec.get("format")
-                    if expected_format and result.example_passed:
-                        actual_ct = resp.headers.get("content-type", "")
-                        # Loose match — "application/json" matches "application/json; charset=utf-8"
-                        result.format_match = expected_format.split(";")[0] in actual_ct
-                        if not result.format_match:
-                            errors.append(
-                                f"Output format mismatch: expected {expected_format}, "
-                                f"got {actual_ct}"
-                            )
-
-                elif method == "GET":
-                    resp = await client.get(
-                        url,
-                        timeout=TIMEOUT,
-                        headers={"User-Agent": "OAP-Trust/0.1"},
-                        follow_redirects=True,
-                    )
-                    result.example_passed = resp.status_code < 400
-                    if not result.example_passed:
-                        errors.append(f"GET invocation returned {resp.status_code}")
-            except httpx.RequestError as e:
-                result.example_passed = False
-                errors.append(f"Example invocation failed: {e}")
+            (
+                result.example_passed,
+                result.format_match,
+                example_errors,
+            ) = await _check_example(client, manifest, examples[0], url, method)
+            errors.extend(example_errors)
 
     result.errors = errors
     result.passed = result.endpoint_live and (result.health_ok is not False)
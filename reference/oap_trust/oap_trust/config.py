@@ -9,6 +9,9 @@ from typing import Any
 
 import yaml
 
+# C-accelerated safe loader when PyYAML was built against libyaml
+_YAMLLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class KeysConfig:
@@ -74,7 +77,7 @@ def load_config(path: str | Path | None = None) -> Config:
         p = Path(path)
         if p.exists():
             with open(p) as f:
-                raw = yaml.safe_load(f) or {}
+                raw = yaml.load(f, Loader=_YAMLLoader) or {}
             if "keys" in raw:
                 cfg.keys = _build_section(KeysConfig, raw["keys"])
             if "database" in raw:
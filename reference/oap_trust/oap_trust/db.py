@@ -23,8 +23,11 @@ CREATE TABLE IF NOT EXISTS attestations (
     expires_at TEXT NOT NULL
 );
 
-CREATE INDEX IF NOT EXISTS idx_attestations_domain ON attestations(domain);
 CREATE INDEX IF NOT EXISTS idx_attestations_expires ON attestations(expires_at);
+CREATE INDEX IF NOT EXISTS idx_attestations_domain_layer
+    ON attestations(domain, layer, issued_at DESC);
+-- domain is the left prefix of idx_attestations_domain_layer
+DROP INDEX IF EXISTS idx_attestations_domain;
 
 CREATE TABLE IF NOT EXISTS challenges (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -36,21 +39,34 @@ CREATE TABLE IF NOT EXISTS challenges (
     expires_at TEXT NOT NULL
 );
 
-CREATE INDEX IF NOT EXISTS idx_challenges_domain ON challenges(domain);
-CREATE INDEX IF NOT EXISTS idx_challenges_token ON challenges(token);
+-- token is UNIQUE, so SQLite already maintains an index on it
+DROP INDEX IF EXISTS idx_challenges_token;
+-- Covers get_pending_challenge so the lookup never touches the table rows
+CREATE INDEX IF NOT EXISTS idx_challenges_domain_status
+    ON challenges(domain, status, created_at DESC, expires_at, token, method);
+-- domain is the left prefix of idx_challenges_domain_status
+DROP INDEX IF EXISTS idx_challenges_domain;
 """
 
+# Columns needed to build an AttestationRecord — skips the row id
+ATTESTATION_COLUMNS = (
+    "domain, layer, jws, manifest_hash, verification_method, issued_at, expires_at"
+)
+
 
 class TrustStore:
     """SQLite-backed store for attestations and challenges."""
 
     def __init__(self, cfg: DatabaseConfig) -> None:
         db_path = Path(cfg.path)
-        db_path.parent.mkdir(parents=True, exist_ok=True)
+        if cfg.path != ":memory:":
+            db_path.parent.mkdir(parents=True, exist_ok=True)
 
         self._conn = sqlite3.connect(str(db_path))
         self._conn.row_factory = sqlite3.Row
         self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL stays consistent with NORMAL; only syncs at checkpoints, not per commit
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         self._conn.execute("PRAGMA foreign_keys=ON")
         self._conn.executescript(SCHEMA)
         log.info("Trust store opened at %s", db_path)
@@ -74,23 +90,29 @@ class TrustStore:
         self._conn.commit()
 
     def get_pending_challenge(self, domain: str) -> dict | None:
-        """Get the most recent pending, non-expired challenge for a domain."""
+        """Get the token, method and created_at of the most recent pending, non-expired challenge."""
         now = datetime.now(timezone.utc).isoformat()
         row = self._conn.execute(
-            "SELECT * FROM challenges "
+            "SELECT token, method, created_at FROM challenges "
             "WHERE domain = ? AND status = 'pending' AND expires_at > ? "
             "ORDER BY created_at DESC LIMIT 1",
             (domain, now),
         ).fetchone()
         return dict(row) if row else None
 
-    def mark_challenge_verified(self, token: str) -> None:
-        """Mark a challenge as verified."""
-        self._conn.execute(
-            "UPDATE challenges SET status = 'verified' WHERE token = ?",
+    def mark_challenge_verified(self, token: str) -> bool:
+        """Mark a pending challenge as verified.
+
+        Single UPDATE ... RETURNING so the check and the claim are atomic.
+        Returns False if the challenge was not pending (already claimed).
+        """
+        row = self._conn.execute(
+            "UPDATE challenges SET status = 'verified' "
+            "WHERE token = ? AND status = 'pending' RETURNING id",
             (token,),
-        )
+        ).fetchone()
         self._conn.commit()
+        return row is not None
 
     def cleanup_expired_challenges(self) -> int:
         """Remove expired challenges. Returns count removed."""
@@ -127,7 +149,8 @@ class TrustStore:
         """Get all non-expired attestations for a domain."""
         now = datetime.now(timezone.utc).isoformat()
         rows = self._conn.execute(
-            "SELECT * FROM attestations WHERE domain = ? AND expires_at > ? "
+            f"SELECT {ATTESTATION_COLUMNS} FROM attestations "
+            "WHERE domain = ? AND expires_at > ? "
             "ORDER BY layer, issued_at DESC",
             (domain, now),
         ).fetchall()
@@ -137,7 +160,7 @@ class TrustStore:
         """Get the most recent non-expired attestation for a domain at a given layer."""
         now = datetime.now(timezone.utc).isoformat()
         row = self._conn.execute(
-            "SELECT * FROM attestations "
+            f"SELECT {ATTESTATION_COLUMNS} FROM attestations "
             "WHERE domain = ? AND layer = ? AND expires_at > ? "
             "ORDER BY issued_at DESC LIMIT 1",
             (domain, layer, now),
@@ -153,6 +176,21 @@ class TrustStore:
         self._conn.commit()
         return cursor.rowcount
 
+    def cleanup_expired(self) -> tuple[int, int]:
+        """Remove expired challenges and attestations in one transaction.
+
+        Returns (challenges_removed, attestations_removed).
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        with self._conn:
+            challenges = self._conn.execute(
+                "DELETE FROM challenges WHERE expires_at <= ?", (now,)
+            ).rowcount
+            attestations = self._conn.execute(
+                "DELETE FROM attestations WHERE expires_at <= ?", (now,)
+            ).rowcount
+        return challenges, attestations
+
     def count_attestations(self) -> int:
         """Total number of non-expired attestations."""
         now = datetime.now(timezone.utc).isoformat()
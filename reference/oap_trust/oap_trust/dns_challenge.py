@@ -10,6 +10,7 @@ import dns.resolver
 import httpx
 
 from .config import AttestationConfig
+from .manifest import REQUEST_HEADERS, http_client
 
 log = logging.getLogger("oap.trust.dns")
 
@@ -79,11 +80,11 @@ async def verify_http_challenge(
     log.info("Checking HTTP challenge: %s", url)
 
     try:
-        async with httpx.AsyncClient() as client:
+        async with http_client() as client:
             resp = await client.get(
                 url,
                 timeout=cfg.request_timeout,
-                headers={"User-Agent": "OAP-Trust/0.1"},
+                headers=REQUEST_HEADERS,
                 follow_redirects=True,
             )
             if resp.status_code == 200 and resp.text.strip() == token:
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import ipaddress
 import json
 import logging
 import socket
-from urllib.parse import urlparse
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from urllib.parse import urljoin, urlparse
 
 import httpx
 
@@ -19,7 +23,52 @@ log = logging.getLogger("oap.trust.manifest")
 REQUIRED_FIELDS = {"oap", "name", "description", "invoke"}
 KNOWN_VERSIONS = {"1.0"}
 USER_AGENT = "OAP-Trust/0.1"
-MAX_MANIFEST_SIZE = 1_048_576  # 1MB
+# Shared by every outbound request; build a copy before adding to it
+REQUEST_HEADERS = {"User-Agent": USER_AGENT}
+MAX_REDIRECTS = 5
+
+# Shared outbound client, installed by the API lifespan (see set_http_client)
+_http: httpx.AsyncClient | None = None
+
+
+# Pool and timeout settings for the shared client; per-request timeouts
+# passed by callers still take precedence
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0
+)
+HTTP_TIMEOUT = httpx.Timeout(10.0)
+
+
+def new_shared_http_client() -> httpx.AsyncClient:
+    """Build the long-lived outbound client the API installs at startup.
+
+    Its cookie jar never stores anything: every attested domain goes through
+    this client, and a cookie set by one target must not be replayed on later
+    probes of it (or pile up for the life of the process).
+    """
+    jar = CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+    return httpx.AsyncClient(cookies=jar, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
+
+def set_http_client(client: httpx.AsyncClient | None) -> None:
+    """Install a shared client for outbound fetches, or None to go per-call."""
+    global _http
+    _http = client
+
+
+@asynccontextmanager
+async def http_client() -> AsyncIterator[httpx.AsyncClient]:
+    """Yield the shared client if one is installed, else a one-off client.
+
+    The API server keeps one pooled client for its lifetime so repeated
+    attestations of the same domain reuse connections; the CLI, which runs
+    a single event loop per command, falls back to a throwaway client.
+    """
+    if _http is not None:
+        yield _http
+    else:
+        async with httpx.AsyncClient() as client:
+            yield client
 
 
 def _is_private_ip(ip_str: str) -> bool:
@@ -37,8 +86,12 @@ def _is_private_ip(ip_str: str) -> bool:
         return True  # Can't parse = block it
 
 
-def _validate_url(url: str, *, allow_http: bool = False) -> str:
-    """Validate a URL for safety. Returns the validated URL."""
+async def _validate_url(url: str, *, allow_http: bool = False) -> str:
+    """Validate a URL for safety. Returns the validated URL.
+
+    DNS resolution goes through the event loop's resolver so concurrent
+    fetches aren't serialized behind a blocking getaddrinfo.
+    """
     parsed = urlparse(url)
 
     if not allow_http and parsed.scheme != "https":
@@ -63,7 +116,7 @@ def _validate_url(url: str, *, allow_http: bool = False) -> str:
 
     # Resolve hostname and check all addresses
     try:
-        addrs = socket.getaddrinfo(hostname, None)
+        addrs = await asyncio.get_running_loop().getaddrinfo(hostname, None)
         ips = {addr[4][0] for addr in addrs}
         if not ips:
             raise ValueError(f"Could not resolve hostname: {hostname}")
@@ -89,25 +142,48 @@ async def fetch_manifest(
     *,
     allow_http: bool = False,
 ) -> tuple[dict, str]:
-    """Fetch /.well-known/oap.json from a domain. Returns (manifest_dict, url)."""
+    """Fetch /.well-known/oap.json from a domain. Returns (manifest_dict, url).
+
+    ``url`` is the well-known URL that was requested, even when redirects were
+    followed to reach the manifest; every hop is held to the same scheme and
+    SSRF checks as the request itself.
+    """
     scheme = "http" if allow_http else "https"
     url = f"{scheme}://{domain}/.well-known/oap.json"
 
-    _validate_url(url, allow_http=allow_http)
-
-    async with httpx.AsyncClient() as client:
-        resp = await client.get(
-            url,
-            timeout=cfg.request_timeout,
-            headers={"User-Agent": USER_AGENT},
-            follow_redirects=True,
-        )
-        resp.raise_for_status()
-
-        if len(resp.content) > MAX_MANIFEST_SIZE:
-            raise ValueError("Manifest too large")
-
-        return resp.json(), url
+    await _validate_url(url, allow_http=allow_http)
+
+    hop = url
+    async with http_client() as client:
+        # Follow redirects by hand: each hop is re-validated (SSRF) and only
+        # the final response body is read, capped at max_manifest_size.
+        for _ in range(MAX_REDIRECTS + 1):
+            req = client.build_request(
+                "GET",
+                hop,
+                timeout=cfg.request_timeout,
+                headers=REQUEST_HEADERS,
+            )
+            resp = await client.send(req, stream=True)
+            try:
+                if resp.is_redirect:
+                    hop = urljoin(hop, resp.headers["location"])
+                    await _validate_url(hop, allow_http=allow_http)
+                    continue
+
+                resp.raise_for_status()
+
+                body = bytearray()
+                async for chunk in resp.aiter_bytes():
+                    body += chunk
+                    if len(body) > cfg.max_manifest_size:
+                        raise ValueError("Manifest too large")
+            finally:
+                await resp.aclose()
+
+            return json.loads(body), url
+
+        raise ValueError(f"Too many redirects fetching {domain}")
 
 
 async def check_layer0(
@@ -58,17 +58,20 @@ def cfg(tmp_dir: Path) -> Config:
     )
 
 
-@pytest.fixture
-def key_manager(cfg: Config) -> KeyManager:
-    """Initialized key manager with ephemeral keys."""
-    km = KeyManager(cfg.keys)
+@pytest.fixture(scope="session")
+def key_manager(tmp_path_factory: pytest.TempPathFactory) -> KeyManager:
+    """Initialized key manager with ephemeral keys, shared by the session.
+
+    A keypair is never modified after initialize(), so one serves every test.
+    """
+    km = KeyManager(KeysConfig(path=str(tmp_path_factory.mktemp("keys"))))
     km.initialize()
     return km
 
 
 @pytest.fixture
-def store(cfg: Config) -> TrustStore:
-    """Fresh trust store in a temp directory."""
-    s = TrustStore(cfg.database)
+def store() -> TrustStore:
+    """Fresh in-memory trust store — no database file to create or sync."""
+    s = TrustStore(DatabaseConfig(path=":memory:"))
     yield s
     s.close()
@@ -34,6 +34,32 @@ class TestHealthEndpoint:
         assert data["key_loaded"] is True
         assert isinstance(data["attestation_count"], int)
 
+    def test_health_cached(self, client: TestClient):
+        """Back-to-back probes should not re-count attestations."""
+        client.get("/health")
+        with patch("oap_trust.api._store.count_attestations") as count:
+            resp = client.get("/health")
+        assert resp.status_code == 200
+        count.assert_not_called()
+
+
+class TestBackendToken:
+    def test_secret_enforced(self, cfg: Config, tmp_dir, monkeypatch):
+        monkeypatch.setenv("OAP_BACKEND_SECRET", "s3cret")
+        with patch("oap_trust.api._find_config", return_value=str(tmp_dir / "config.yaml")), \
+             patch("oap_trust.api.load_config", return_value=cfg):
+            with TestClient(app) as c:
+                assert c.get("/health").status_code == 403
+                assert c.get("/health", headers={"X-Backend-Token": "wrong"}).status_code == 403
+                assert c.get("/health", headers={"X-Backend-Token": "s3cret"}).status_code == 200
+
+    def test_secret_enforced_without_lifespan(self, monkeypatch):
+        """A request that never ran lifespan must still be checked."""
+        monkeypatch.setenv("OAP_BACKEND_SECRET", "s3cret")
+        c = TestClient(app)
+        assert c.get("/health").status_code == 403
+        assert c.get("/health", headers={"X-Backend-Token": "wrong"}).status_code == 403
+
 
 class TestKeysEndpoint:
     def test_jwks(self, client: TestClient):
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, patch
 
 import httpx
@@ -12,6 +13,7 @@ from oap_trust.attestation import AttestationService
 from oap_trust.config import Config
 from oap_trust.db import TrustStore
 from oap_trust.keys import KeyManager
+from oap_trust.manifest import hash_manifest
 
 from .conftest import SAMPLE_MANIFEST
 
@@ -21,6 +23,13 @@ class TestAttestationService:
     def service(self, cfg: Config, key_manager: KeyManager, store: TrustStore):
         return AttestationService(cfg, key_manager, store)
 
+    @pytest.fixture
+    def challenge_passes(self, monkeypatch: pytest.MonkeyPatch):
+        """Make challenge verification succeed without DNS or HTTP."""
+        monkeypatch.setattr(
+            "oap_trust.attestation.verify_challenge", AsyncMock(return_value=True)
+        )
+
     @respx.mock
     @pytest.mark.asyncio
     async def test_initiate_domain_attestation(self, service: AttestationService):
@@ -47,6 +56,7 @@ class TestAttestationService:
 
     @respx.mock
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("challenge_passes")
     async def test_full_challenge_flow(self, service: AttestationService):
         """Full flow: initiate -> verify challenge -> get attestation."""
         respx.get("https://example.com/.well-known/oap.json").mock(
@@ -55,14 +65,7 @@ class TestAttestationService:
 
         # Initiate
         challenge = await service.initiate_domain_attestation("example.com", "dns")
-
-        # Mock DNS verification to succeed
-        with patch(
-            "oap_trust.attestation.verify_challenge",
-            new_callable=AsyncMock,
-            return_value=True,
-        ):
-            status = await service.verify_domain_attestation("example.com")
+        status = await service.verify_domain_attestation("example.com")
 
         assert status.challenge_verified
         assert status.attestation is not None
@@ -92,6 +95,85 @@ class TestAttestationService:
         assert not status.challenge_verified
         assert status.attestation is None
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_lost_claim_returns_winners_attestation(
+        self, service: AttestationService, store: TrustStore
+    ):
+        """A request that loses the claim race reports the winner's attestation."""
+        respx.get("https://example.com/.well-known/oap.json").mock(
+            return_value=httpx.Response(200, json=SAMPLE_MANIFEST)
+        )
+        await service.initiate_domain_attestation("example.com", "dns")
+
+        async def winner_finishes_first(domain, token, method, cfg):
+            store.mark_challenge_verified(token)
+            now = datetime.now(timezone.utc)
+            store.store_attestation(
+                domain, 1, "jws-winner", "sha256:x", method, now, now + timedelta(days=1)
+            )
+            return True
+
+        with patch(
+            "oap_trust.attestation.verify_challenge", side_effect=winner_finishes_first
+        ):
+            status = await service.verify_domain_attestation("example.com")
+
+        assert status.challenge_verified
+        assert status.error is None
+        assert status.attestation is not None
+        assert status.attestation.jws == "jws-winner"
+        assert len(service.get_attestations("example.com")) == 1
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_lost_claim_while_winner_signing(
+        self, service: AttestationService, store: TrustStore
+    ):
+        """Losing the race before the winner stores anything is not a success."""
+        respx.get("https://example.com/.well-known/oap.json").mock(
+            return_value=httpx.Response(200, json=SAMPLE_MANIFEST)
+        )
+        await service.initiate_domain_attestation("example.com", "dns")
+
+        async def claimed_elsewhere(domain, token, method, cfg):
+            store.mark_challenge_verified(token)
+            return True
+
+        with patch("oap_trust.attestation.verify_challenge", side_effect=claimed_elsewhere):
+            status = await service.verify_domain_attestation("example.com")
+
+        assert not status.challenge_verified
+        assert status.attestation is None
+        assert "another request" in status.error
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_lost_claim_ignores_older_attestation(
+        self, service: AttestationService, store: TrustStore
+    ):
+        """An attestation issued before this challenge is not the winner's."""
+        respx.get("https://example.com/.well-known/oap.json").mock(
+            return_value=httpx.Response(200, json=SAMPLE_MANIFEST)
+        )
+        earlier = datetime.now(timezone.utc) - timedelta(days=1)
+        store.store_attestation(
+            "example.com", 1, "jws-old", "sha256:old", "dns",
+            earlier, earlier + timedelta(days=90),
+        )
+        await service.initiate_domain_attestation("example.com", "dns")
+
+        async def claimed_elsewhere(domain, token, method, cfg):
+            store.mark_challenge_verified(token)
+            return True
+
+        with patch("oap_trust.attestation.verify_challenge", side_effect=claimed_elsewhere):
+            status = await service.verify_domain_attestation("example.com")
+
+        assert not status.challenge_verified
+        assert status.attestation is None
+        assert "/v1/attestations/example.com" in status.error
+
     @pytest.mark.asyncio
     async def test_verify_no_pending_challenge(self, service: AttestationService):
         """Verify with no pending challenge should return error."""
@@ -101,6 +183,34 @@ class TestAttestationService:
 
     @respx.mock
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("challenge_passes")
+    async def test_attestation_after_redirect(
+        self, service: AttestationService, key_manager: KeyManager
+    ):
+        """A redirected manifest is attested for the requested domain and its body."""
+        respx.get("https://example.com/.well-known/oap.json").mock(
+            return_value=httpx.Response(
+                301, headers={"location": "https://cdn.example.net/oap.json"}
+            )
+        )
+        respx.get("https://cdn.example.net/oap.json").mock(
+            return_value=httpx.Response(200, json=SAMPLE_MANIFEST)
+        )
+
+        await service.initiate_domain_attestation("example.com", "dns")
+        status = await service.verify_domain_attestation("example.com")
+
+        stored = service.get_attestations("example.com")
+        assert len(stored) == 1
+        assert stored[0].domain == "example.com"
+        assert stored[0].manifest_hash == hash_manifest(SAMPLE_MANIFEST)
+        decoded = key_manager.verify(status.attestation.jws)
+        assert decoded["sub"] == "example.com"
+        assert decoded["oap_manifest_hash"] == hash_manifest(SAMPLE_MANIFEST)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    @pytest.mark.usefixtures("challenge_passes")
     async def test_attestation_signature_roundtrip(
         self, service: AttestationService, key_manager: KeyManager
     ):
@@ -111,12 +221,7 @@ class TestAttestationService:
 
         challenge = await service.initiate_domain_attestation("example.com", "dns")
 
-        with patch(
-            "oap_trust.attestation.verify_challenge",
-            new_callable=AsyncMock,
-            return_value=True,
-        ):
-            status = await service.verify_domain_attestation("example.com")
+        status = await service.verify_domain_attestation("example.com")
 
         # Verify the JWS token
         decoded = key_manager.verify(status.attestation.jws)
@@ -126,6 +231,7 @@ class TestAttestationService:
 
     @respx.mock
     @pytest.mark.asyncio
+    @pytest.mark.usefixtures("challenge_passes")
     async def test_get_attestations(self, service: AttestationService):
         """Stored attestations should be retrievable."""
         respx.get("https://example.com/.well-known/oap.json").mock(
@@ -133,12 +239,7 @@ class TestAttestationService:
         )
 
         await service.initiate_domain_attestation("example.com", "dns")
-        with patch(
-            "oap_trust.attestation.verify_challenge",
-            new_callable=AsyncMock,
-            return_value=True,
-        ):
-            await service.verify_domain_attestation("example.com")
+        await service.verify_domain_attestation("example.com")
 
         attestations = service.get_attestations("example.com")
         assert len(attestations) == 1
@@ -170,6 +271,8 @@ class TestAttestationService:
         test_result, attestation = await service.attest_capability("example.com")
         assert test_result.passed
         assert test_result.endpoint_live
+        assert test_result.example_passed
+        assert test_result.format_match
         assert attestation is not None
         assert attestation.layer == 2
 
@@ -186,7 +289,34 @@ class TestAttestationService:
         respx.get("https://example.com/health").mock(
             return_value=httpx.Response(503)
         )
+        invoke = respx.post("https://example.com/api/test").mock(
+            return_value=httpx.Response(200)
+        )
 
         test_result, attestation = await service.attest_capability("example.com")
         assert not test_result.passed
         assert attestation is None
+        # The example invocation is never sent to a dead endpoint
+        assert not invoke.called
+        assert test_result.example_passed is None
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_capability_auth_gated_skips_dns(self, service: AttestationService):
+        """Auth-gated endpoints are rejected before the invoke URL is resolved."""
+        manifest = {
+            **SAMPLE_MANIFEST,
+            "invoke": {**SAMPLE_MANIFEST["invoke"], "auth": "bearer"},
+        }
+        respx.get("https://example.com/.well-known/oap.json").mock(
+            return_value=httpx.Response(200, json=manifest)
+        )
+
+        with patch(
+            "oap_trust.capability_test._validate_url", new_callable=AsyncMock
+        ) as validate:
+            test_result, attestation = await service.attest_capability("example.com")
+        validate.assert_not_called()
+        assert not test_result.passed
+        assert "auth-gated" in test_result.errors[0]
+        assert attestation is None
@@ -0,0 +1,48 @@
+"""Tests for the SQLite trust store."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from oap_trust.db import TrustStore
+
+
+# Fixed expiry far enough out that nothing in the suite ever sees it lapse
+_FUTURE = datetime(2100, 1, 1, tzinfo=timezone.utc)
+
+
+class TestChallenges:
+    def test_pending_challenge_roundtrip(self, store: TrustStore):
+        store.create_challenge("example.com", "tok-1", "dns", _FUTURE)
+        challenge = store.get_pending_challenge("example.com")
+        assert challenge is not None
+        assert challenge["token"] == "tok-1"
+        assert challenge["method"] == "dns"
+        assert challenge["created_at"]
+
+    def test_mark_verified_claims_once(self, store: TrustStore):
+        """Only the first caller should be able to claim a pending challenge."""
+        store.create_challenge("example.com", "tok-1", "dns", _FUTURE)
+        assert store.mark_challenge_verified("tok-1") is True
+        assert store.mark_challenge_verified("tok-1") is False
+        assert store.get_pending_challenge("example.com") is None
+
+    def test_mark_verified_unknown_token(self, store: TrustStore):
+        assert store.mark_challenge_verified("missing") is False
+
+
+class TestCleanup:
+    def test_cleanup_expired_removes_both(self, store: TrustStore):
+        past = datetime.now(timezone.utc) - timedelta(hours=1)
+        store.create_challenge("example.com", "old", "dns", past)
+        store.create_challenge("example.com", "new", "dns", _FUTURE)
+        store.store_attestation(
+            "example.com", 1, "jws-old", "sha256:x", "dns", past - timedelta(days=1), past
+        )
+        store.store_attestation(
+            "example.com", 1, "jws-new", "sha256:x", "dns", past, _FUTURE
+        )
+
+        assert store.cleanup_expired() == (1, 1)
+        assert store.get_pending_challenge("example.com")["token"] == "new"
+        assert [a["jws"] for a in store.get_attestations("example.com")] == ["jws-new"]
@@ -9,7 +9,13 @@ import pytest
 import respx
 
 from oap_trust.config import AttestationConfig
-from oap_trust.manifest import check_layer0, fetch_manifest, hash_manifest
+from oap_trust.manifest import (
+    check_layer0,
+    fetch_manifest,
+    hash_manifest,
+    new_shared_http_client,
+    set_http_client,
+)
 
 from .conftest import SAMPLE_MANIFEST, SAMPLE_MANIFEST_MINIMAL
 
@@ -67,6 +73,54 @@ class TestFetchManifest:
         )
         assert manifest["name"] == "Test Capability"
 
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_fetch_follows_redirect(self, attest_cfg: AttestationConfig):
+        """Redirects are followed; the requested URL is still the one returned."""
+        respx.get("https://example.com/.well-known/oap.json").mock(
+            return_value=httpx.Response(
+                301, headers={"location": "https://www.example.com/.well-known/oap.json"}
+            )
+        )
+        respx.get("https://www.example.com/.well-known/oap.json").mock(
+            return_value=httpx.Response(200, json=SAMPLE_MANIFEST)
+        )
+        manifest, url = await fetch_manifest("example.com", attest_cfg)
+        assert manifest["name"] == "Test Capability"
+        assert url == "https://example.com/.well-known/oap.json"
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_fetch_too_large(self):
+        """Bodies over max_manifest_size should be rejected."""
+        cfg = AttestationConfig(request_timeout=5, max_manifest_size=64)
+        respx.get("https://example.com/.well-known/oap.json").mock(
+            return_value=httpx.Response(200, json=SAMPLE_MANIFEST)
+        )
+        with pytest.raises(ValueError, match="too large"):
+            await fetch_manifest("example.com", cfg)
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_shared_client_drops_cookies(self, attest_cfg: AttestationConfig):
+        """A Set-Cookie from one fetch is not sent back on the next."""
+        route = respx.get("https://example.com/.well-known/oap.json").mock(
+            return_value=httpx.Response(
+                200, json=SAMPLE_MANIFEST, headers={"set-cookie": "track=1; Path=/"}
+            )
+        )
+        client = new_shared_http_client()
+        set_http_client(client)
+        try:
+            await fetch_manifest("example.com", attest_cfg)
+            await fetch_manifest("example.com", attest_cfg)
+        finally:
+            set_http_client(None)
+            await client.aclose()
+        assert route.call_count == 2
+        assert "cookie" not in route.calls[1].request.headers
+        assert len(client.cookies) == 0
+
 
 class TestLayer0:
     @respx.mock
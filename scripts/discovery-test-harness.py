@@ -29,6 +29,7 @@ import argparse
 import json
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, asdict
 from typing import Any
 
@@ -147,6 +148,15 @@ def send_chat(
         return None
 
 
+def _timed_chat(
+    base_url: str, task: str, model: str, timeout: float, no_cache: bool,
+) -> tuple[dict[str, Any] | None, float]:
+    """send_chat plus its wall-clock duration."""
+    t0 = time.monotonic()
+    response = send_chat(base_url, task, model, timeout, no_cache=no_cache)
+    return response, time.monotonic() - t0
+
+
 # ---------------------------------------------------------------------------
 # Verification
 # ---------------------------------------------------------------------------
@@ -1090,81 +1100,98 @@ def run_tests(
     dry_run: bool,
     log_file: Any | None = None,
     no_cache: bool = False,
+    concurrency: int = 1,
 ) -> list[TestResult]:
     results: list[TestResult] = []
     total = len(tests)
     start_all = time.monotonic()
     consecutive_skips = 0
 
-    for i, tc in enumerate(tests, 1):
-        if dry_run:
-            print(f"[{i:3d}/{total}] {tc.id:<14s}  {tc.category:<10s}  {tc.task[:60]}")
-            continue
+    # With concurrency > 1 every request is submitted up front; results are
+    # still verified and printed in test order
+    pool: ThreadPoolExecutor | None = None
+    pending = []
+    if concurrency > 1 and not dry_run:
+        pool = ThreadPoolExecutor(max_workers=concurrency)
+        pending = [
+            pool.submit(_timed_chat, base_url, tc.task, model, timeout, no_cache)
+            for tc in tests
+        ]
 
-        elapsed_so_far = time.monotonic() - start_all
-        if i > 1 and results:
-            avg = elapsed_so_far / (i - 1)
-            eta = avg * (total - i + 1)
-            eta_str = f"  ETA {format_duration(eta)}"
-        else:
-            eta_str = ""
-
-        # Back off after consecutive timeouts — Ollama serializes requests,
-        # so a timed-out request is likely still running. Wait for it to drain.
-        if consecutive_skips >= 2:
-            cooldown = min(30, consecutive_skips * 10)
-            print(dim(f"    [{consecutive_skips} consecutive timeouts, cooling down {cooldown}s...]"))
-            time.sleep(cooldown)
-
-        t0 = time.monotonic()
-        response = send_chat(base_url, tc.task, model, timeout, no_cache=no_cache)
-        duration = time.monotonic() - t0
-
-        result = verify_test(tc, response, duration)
-        if result.verdict == SKIP:
-            consecutive_skips += 1
-        else:
-            consecutive_skips = 0
-        results.append(result)
-
-        # Write full response to log file (JSONL)
-        if log_file is not None:
-            log_entry = {
-                "test_id": tc.id,
-                "category": tc.category,
-                "task": tc.task,
-                "verdict": result.verdict,
-                "tool_called": result.tool_called,
-                "detail": result.detail,
-                "duration_s": round(duration, 2),
-                "message_content": (response or {}).get("message", {}).get("content", ""),
-                "oap_debug": (response or {}).get("oap_debug"),
-                "similar_experience_tools": (response or {}).get("oap_debug", {}).get("similar_experience_tools") if (response or {}).get("oap_debug") else None,
-                "oap_experience_cache": (response or {}).get("oap_experience_cache"),
-                "oap_tools_injected": (response or {}).get("oap_tools_injected"),
-            }
-            log_file.write(json.dumps(log_entry) + "\n")
-            log_file.flush()
-
-        color_fn = VERDICT_COLOR.get(result.verdict, str)
-        tool_display = result.tool_called or "-"
-        task_preview = tc.task.replace("\n", " ")[:50]
-
-        line = f"[{i:3d}/{total}] {tc.id:<14s}{color_fn(result.verdict):<6s}{tool_display:<16s}{duration:5.1f}s  {dim(task_preview)}"
-        if result.detail:
-            line += f"  {dim('[' + result.detail + ']')}"
-        print(line + eta_str)
-
-        if verbose and result.verdict == FAIL and result.debug:
-            print(dim("    Debug: " + json.dumps(result.debug, indent=2)[:500]))
-
-        if fail_fast and result.verdict == FAIL:
-            print(red("\n  Stopping: --fail-fast triggered"))
-            break
-
-        if consecutive_skips >= 5:
-            print(red(f"\n  Stopping: {consecutive_skips} consecutive timeouts — Ollama may be stuck"))
-            break
+    try:
+        for i, tc in enumerate(tests, 1):
+            if dry_run:
+                print(f"[{i:3d}/{total}] {tc.id:<14s}  {tc.category:<10s}  {tc.task[:60]}")
+                continue
+
+            elapsed_so_far = time.monotonic() - start_all
+            if i > 1 and results:
+                avg = elapsed_so_far / (i - 1)
+                eta = avg * (total - i + 1)
+                eta_str = f"  ETA {format_duration(eta)}"
+            else:
+                eta_str = ""
+
+            if pool is not None:
+                response, duration = pending[i - 1].result()
+            else:
+                # Back off after consecutive timeouts — Ollama serializes requests,
+                # so a timed-out request is likely still running. Wait for it to drain.
+                if consecutive_skips >= 2:
+                    cooldown = min(30, consecutive_skips * 10)
+                    print(dim(f"    [{consecutive_skips} consecutive timeouts, cooling down {cooldown}s...]"))
+                    time.sleep(cooldown)
+
+                response, duration = _timed_chat(base_url, tc.task, model, timeout, no_cache)
+
+            result = verify_test(tc, response, duration)
+            if result.verdict == SKIP:
+                consecutive_skips += 1
+            else:
+                consecutive_skips = 0
+            results.append(result)
+
+            # Write full response to log file (JSONL)
+            if log_file is not None:
+                log_entry = {
+                    "test_id": tc.id,
+                    "category": tc.category,
+                    "task": tc.task,
+                    "verdict": result.verdict,
+                    "tool_called": result.tool_called,
+                    "detail": result.detail,
+                    "duration_s": round(duration, 2),
+                    "message_content": (response or {}).get("message", {}).get("content", ""),
+                    "oap_debug": (response or {}).get("oap_debug"),
+                    "similar_experience_tools": (response or {}).get("oap_debug", {}).get("similar_experience_tools") if (response or {}).get("oap_debug") else None,
+                    "oap_experience_cache": (response or {}).get("oap_experience_cache"),
+                    "oap_tools_injected": (response or {}).get("oap_tools_injected"),
+                }
+                log_file.write(json.dumps(log_entry) + "\n")
+                log_file.flush()
+
+            color_fn = VERDICT_COLOR.get(result.verdict, str)
+            tool_display = result.tool_called or "-"
+            task_preview = tc.task.replace("\n", " ")[:50]
+
+            line = f"[{i:3d}/{total}] {tc.id:<14s}{color_fn(result.verdict):<6s}{tool_display:<16s}{duration:5.1f}s  {dim(task_preview)}"
+            if result.detail:
+                line += f"  {dim('[' + result.detail + ']')}"
+            print(line + eta_str)
+
+            if verbose and result.verdict == FAIL and result.debug:
+                print(dim("    Debug: " + json.dumps(result.debug, indent=2)[:500]))
+
+            if fail_fast and result.verdict == FAIL:
+                print(red("\n  Stopping: --fail-fast triggered"))
+                break
+
+            if consecutive_skips >= 5:
+                print(red(f"\n  Stopping: {consecutive_skips} consecutive timeouts — Ollama may be stuck"))
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
 
     return results
 
@@ -1373,6 +1400,9 @@ def main() -> None:
                         help="Run only the first 10 tests")
     parser.add_argument("--dry-run", action="store_true",
                         help="List tests without executing")
+    parser.add_argument("--concurrency", type=int, default=1,
+                        help="Requests in flight at once (default: 1; raise only if "
+                             "the server's Ollama runs requests in parallel)")
     parser.add_argument("--fail-fast", action="store_true",
                         help="Stop on first FAIL verdict")
     parser.add_argument("--verbose", action="store_true",
@@ -1438,6 +1468,7 @@ def main() -> None:
         args.dry_run,
         log_file,
         no_cache=args.no_cache,
+        concurrency=args.concurrency,
     )
 
     # Cache tests
@@ -9,6 +9,7 @@ Usage:
     python scripts/manifest-factory.py --source help --tools rg,fd  # --help output
     python scripts/manifest-factory.py --source openapi --spec petstore.json
     python scripts/manifest-factory.py --dry-run                    # preview only
+    python scripts/manifest-factory.py --concurrency 4              # 4 requests in flight
 """
 
 from __future__ import annotations
@@ -21,10 +22,22 @@ import shutil
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import httpx
 
+try:  # Optional fast JSON codec for Ollama requests/responses
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode()
+
 # --- Paths ---
 
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -110,6 +123,48 @@ HELP_MAX_CHARS = 5000
 
 DEFAULT_OLLAMA_URL = "http://localhost:11434"
 OLLAMA_MODEL = "qwen3:8b"
+OLLAMA_TIMEOUT = 120
+
+# Static part of every /api/chat request; only "messages" varies per tool
+_CHAT_PAYLOAD = {
+    "model": OLLAMA_MODEL,
+    "format": "json",
+    "options": {"temperature": 0, "num_ctx": 8192},
+    "think": False,
+    "stream": True,
+}
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# One keep-alive client for the whole run (httpx.Client is thread-safe)
+_ollama_client: httpx.Client | None = None
+
+
+def get_ollama_client(ollama_url: str, pool_size: int = 1) -> httpx.Client:
+    """Return the shared Ollama client, creating it on first use.
+
+    The pool keeps ``pool_size`` connections alive so every worker thread
+    reuses its own — httpx's default keep-alive cap (20) would otherwise
+    drop and reopen connections at higher --concurrency.
+    """
+    global _ollama_client
+    if _ollama_client is None:
+        limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        _ollama_client = httpx.Client(base_url=ollama_url, timeout=OLLAMA_TIMEOUT, limits=limits)
+    return _ollama_client
+
+
+# Resolved command paths — shutil.which walks PATH on every call
+_WHICH_CACHE: dict[str, str] = {}
+
+
+def resolve_command(name: str) -> str | None:
+    """Resolve a command on PATH, caching successful lookups."""
+    resolved = _WHICH_CACHE.get(name)
+    if resolved is None:
+        resolved = shutil.which(name)
+        if resolved is not None:
+            _WHICH_CACHE[name] = resolved
+    return resolved
 
 
 def load_example(name: str) -> str:
@@ -118,6 +173,19 @@ def load_example(name: str) -> str:
     return path.read_text().strip()
 
 
+def truncate_docs(text: str, limit: int) -> str:
+    """Cap docs at ``limit`` chars, cutting at the last line break before it.
+
+    A single rfind finds the cut, so the model never sees half an option line.
+    """
+    if len(text) <= limit:
+        return text
+    cut = text.rfind("\n", 0, limit)
+    if cut <= 0:  # One huge line — fall back to a hard cut
+        cut = limit
+    return text[:cut] + "\n[... truncated ...]"
+
+
 # --- Source Adapter Interface ---
 
 class SourceAdapter(abc.ABC):
@@ -188,7 +256,7 @@ class ManPageAdapter(SourceAdapter):
             return False
         if any(name.startswith(p) for p in BLOCKLIST_PREFIXES):
             return False
-        resolved = shutil.which(name)
+        resolved = resolve_command(name)
         if resolved is None:
             return False
         return any(resolved.startswith(p) for p in ALLOWED_PREFIXES)
@@ -206,10 +274,7 @@ class ManPageAdapter(SourceAdapter):
         if not text or result.returncode != 0:
             return None
 
-        if len(text) > MAN_PAGE_MAX_CHARS:
-            text = text[:MAN_PAGE_MAX_CHARS] + "\n[... truncated ...]"
-
-        return text
+        return truncate_docs(text, MAN_PAGE_MAX_CHARS)
 
     def get_system_prompt(self) -> str:
         return _build_stdio_system_prompt()
@@ -244,7 +309,7 @@ class HelpAdapter(SourceAdapter):
             return False
         if any(name.startswith(p) for p in BLOCKLIST_PREFIXES):
             return False
-        resolved = shutil.which(name)
+        resolved = resolve_command(name)
         if resolved is None:
             return False
         return any(resolved.startswith(p) for p in ALLOWED_PREFIXES)
@@ -263,10 +328,7 @@ class HelpAdapter(SourceAdapter):
         if not text:
             return None
 
-        if len(text) > HELP_MAX_CHARS:
-            text = text[:HELP_MAX_CHARS] + "\n[... truncated ...]"
-
-        return text
+        return truncate_docs(text, HELP_MAX_CHARS)
 
     def get_system_prompt(self) -> str:
         return _build_stdio_system_prompt()
@@ -434,10 +496,7 @@ class OpenAPIAdapter(SourceAdapter):
                     break
 
         text = "\n".join(parts)
-        if len(text) > MAN_PAGE_MAX_CHARS:
-            text = text[:MAN_PAGE_MAX_CHARS] + "\n[... truncated ...]"
-
-        return text
+        return truncate_docs(text, MAN_PAGE_MAX_CHARS)
 
     def get_system_prompt(self) -> str:
         return f"""You generate OAP manifest JSON files for HTTP API endpoints.
@@ -576,6 +635,10 @@ def main():
         "--ollama-url", default=DEFAULT_OLLAMA_URL,
         help=f"Ollama API URL (default: {DEFAULT_OLLAMA_URL})",
     )
+    parser.add_argument(
+        "--concurrency", type=int, default=1,
+        help="Concurrent Ollama requests — match OLLAMA_NUM_PARALLEL (default: 1)",
+    )
     parser.add_argument(
         "--force", action="store_true",
         help="Regenerate existing manifests (overwrite)",
@@ -592,11 +655,12 @@ def main():
     adapter.configure(args)
 
     ollama_url = args.ollama_url
+    client = get_ollama_client(ollama_url, pool_size=max(1, args.concurrency))
 
     # Check Ollama is reachable (skip for dry runs)
     if not args.dry_run:
         try:
-            resp = httpx.get(f"{ollama_url}/api/tags", timeout=10)
+            resp = client.get("/api/tags", timeout=10)
             resp.raise_for_status()
             models = [m["name"] for m in resp.json().get("models", [])]
             if not any(OLLAMA_MODEL in m for m in models):
@@ -628,10 +692,14 @@ def main():
             if line.strip() and not line.startswith("#")
         }
 
-    # Filter
+    # Filter (single pass; repeated names are generated once)
     filtered = []
+    seen: set[str] = set()
     skipped = {"disallowed": 0, "existing": 0, "excluded": 0}
     for name in names:
+        if name in seen:
+            continue
+        seen.add(name)
         if name in force_exclude:
             skipped["excluded"] += 1
             continue
@@ -659,19 +727,19 @@ def main():
     stats = {"success": 0, "failed": 0, "no_docs": 0, "invalid": 0}
     start_all = time.monotonic()
 
-    for i, name in enumerate(filtered, 1):
+    def process(i: int, name: str) -> str | None:
+        """Generate one manifest. Returns the stats key for the outcome."""
         prefix = f"[{i}/{len(filtered)}] {name}"
 
         # Get documentation
         docs = adapter.get_docs(name)
         if not docs:
             print(f"{prefix}: no docs, skipping")
-            stats["no_docs"] += 1
-            continue
+            return "no_docs"
 
         if args.dry_run:
             print(f"{prefix}: would generate (docs: {len(docs)} chars)")
-            continue
+            return None
 
         # Generate via LLM
         user_prompt = f"""Here is the documentation for `{name}`:
@@ -680,11 +748,10 @@ def main():
 
 Generate the OAP manifest JSON for `{name}`."""
 
-        result = _generate_manifest(name, user_prompt, system_prompt, ollama_url)
+        result = _generate_manifest(name, user_prompt, system_prompt, client)
         if result is None:
             print(f"{prefix}: generation failed")
-            stats["failed"] += 1
-            continue
+            return "failed"
 
         manifest = result["manifest"]
         tokens = result["tokens"]
@@ -694,8 +761,7 @@ Generate the OAP manifest JSON for `{name}`."""
         validation = validate_manifest(manifest)
         if not validation["valid"]:
             print(f"{prefix}: invalid — {'; '.join(validation['errors'])}")
-            stats["invalid"] += 1
-            continue
+            return "invalid"
 
         # Adapter-specific fixup
         manifest = adapter.fixup(name, manifest)
@@ -706,7 +772,19 @@ Generate the OAP manifest JSON for `{name}`."""
 
         warnings = f" (warnings: {'; '.join(validation['warnings'])})" if validation["warnings"] else ""
         print(f"{prefix}: OK — {tokens} tokens, {duration:.1f}s{warnings}")
-        stats["success"] += 1
+        return "success"
+
+    # Ollama batches concurrent requests up to OLLAMA_NUM_PARALLEL, so keeping
+    # several in flight amortizes per-request model overhead
+    if args.concurrency > 1 and not args.dry_run:
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            outcomes = list(pool.map(process, range(1, len(filtered) + 1), filtered))
+    else:
+        outcomes = [process(i, name) for i, name in enumerate(filtered, 1)]
+
+    for outcome in outcomes:
+        if outcome:
+            stats[outcome] += 1
 
     elapsed = time.monotonic() - start_all
 
@@ -721,41 +799,50 @@ def _generate_manifest(
     name: str,
     user_prompt: str,
     system_prompt: str,
-    ollama_url: str,
+    client: httpx.Client,
 ) -> dict | None:
     """Call Ollama to generate a manifest."""
-    payload = {
-        "model": OLLAMA_MODEL,
+    payload = _CHAT_PAYLOAD | {
         "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ],
-        "format": "json",
-        "options": {"temperature": 0, "num_ctx": 8192},
-        "think": False,
-        "stream": False,
     }
 
+    # Streamed NDJSON: bytes keep arriving while the model generates, so the
+    # read timeout bounds the gap between tokens rather than the whole
+    # generation, and each chunk is parsed as it lands.
+    parts: list[str] = []
+    data: dict = {}
     try:
-        resp = httpx.post(
-            f"{ollama_url}/api/chat",
-            json=payload,
-            timeout=120,
-        )
-        resp.raise_for_status()
+        # Pre-encoded body: the prompts are large and orjson emits bytes directly
+        with client.stream(
+            "POST", "/api/chat", content=_json_dumps(payload), headers=_JSON_HEADERS,
+        ) as resp:
+            resp.raise_for_status()
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                data = _json_loads(line)
+                if "error" in data:  # Mid-stream failures arrive as an error chunk
+                    print(f"  Ollama error: {data['error']}", file=sys.stderr)
+                    return None
+                parts.append(data.get("message", {}).get("content", ""))
+                if data.get("done"):
+                    break
     except (httpx.HTTPError, httpx.TimeoutException) as e:
         print(f"  Ollama error: {e}", file=sys.stderr)
         return None
 
-    data = resp.json()
-    content = data.get("message", {}).get("content", "")
+    # The final (done) chunk carries the eval stats
+    content = "".join(parts)
     tokens = data.get("eval_count", 0)
     duration_ns = data.get("eval_duration", 0)
     duration_s = duration_ns / 1e9 if duration_ns else 0
 
     try:
-        manifest = json.loads(content)
-    except json.JSONDecodeError as e:
+        manifest = _json_loads(content)
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError subclasses this
         print(f"  JSON parse error: {e}", file=sys.stderr)
         return None
 